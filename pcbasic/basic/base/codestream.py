@@ -14,6 +14,10 @@ from . import tokens as tk
 from .tokens import DIGITS, HEXDIGITS, OCTDIGITS, LETTERS
 
 
+# number of bytes to read ahead at a time when reading a name
+_NAME_CHUNK = 16
+
+
 class CodeStream(io.BytesIO):
     """Stream of various kinds of code."""
 
@@ -74,7 +78,16 @@ class CodeStream(io.BytesIO):
 
     def skip_blank_read_if(self, in_range, n=1):
         """Skip whitespace, then read if next char is in range."""
-        return self.read_if(self.skip_blank(n=n), in_range)
+        # inlined skip_blank and read_if, this is called for most separators
+        d = self.read(1)
+        while d and d in self.blanks:
+            d = self.read(1)
+        if n > 1:
+            d += self.read(n-1)
+        if d and d in in_range:
+            return d
+        self.seek(-len(d), 1)
+        return None
 
     def read_to(self, findrange):
         """Read until a character from a given range is found."""
@@ -96,16 +109,22 @@ class CodeStream(io.BytesIO):
             # variable name must start with a letter
             self.seek(-len(d), 1)
             return b''
-        name = b''
-        while d and d in tk.NAME_CHARS:
-            name += d
-            d = self.read(1)
+        name = d
+        # read ahead in chunks and cut at the first char that can't be in a name
+        while True:
+            chunk = self.read(_NAME_CHUNK)
+            tail = chunk.lstrip(tk.NAME_CHARS)
+            name += chunk[:len(chunk)-len(tail)]
+            if tail or len(chunk) < _NAME_CHUNK:
+                break
         # only the first 40 chars are relevant in GW-BASIC, rest is discarded
         name = name[:40]
+        d = tail[:1]
         if d in tk.SIGILS:
             name += d
-        else:
-            self.seek(-len(d), 1)
+            tail = tail[1:]
+        # give back what we read beyond the name
+        self.seek(-len(tail), 1)
         # names are not case sensitive
         return name.upper()
 
@@ -267,7 +286,8 @@ class TokenisedStream(CodeStream):
                 rem = False
             if literal or rem:
                 continue
-            if c + self.peek(nchars-1) in findrange:
+            # don't peek for single-byte ranges, this loop runs for every byte skipped
+            if (c if nchars == 1 else c + self.peek(nchars-1)) in findrange:
                 if break_on_first_char:
                     self.seek(-1, 1)
                     break
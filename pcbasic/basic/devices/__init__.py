@@ -7,5 +7,5 @@ This file is released under the GNU GPL version 3 or later.
 """
 
 from .devicebase import TYPE_TO_MAGIC, InputTextFile
-from .files import Files
+from .files import Files, MODE_IR
 from .disk import NameWrapper
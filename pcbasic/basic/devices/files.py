@@ -34,6 +34,24 @@ DEFAULT_MOUNTS = {b'Z': (getcwdu(), u'')}
 # allowable drive letters in GW-BASIC are letters or @
 DRIVE_LETTERS = b'@' + tk.UPPERCASE
 
+# mode letters in OPEN first syntax, either case
+FIRST_SYNTAX_MODES = {
+    b'I': b'I', b'O': b'O', b'A': b'A', b'R': b'R',
+    b'i': b'I', b'o': b'O', b'a': b'A', b'r': b'R',
+}
+
+# file mode flags for checking allowed modes
+MODE_I, MODE_O, MODE_A, MODE_R = 1, 2, 4, 8
+MODE_IR = MODE_I | MODE_R
+MODE_OAR = MODE_O | MODE_A | MODE_R
+MODE_IOAR = MODE_I | MODE_O | MODE_A | MODE_R
+
+# flag for each file mode letter, either case
+_MODE_FLAGS = {
+    b'I': MODE_I, b'O': MODE_O, b'A': MODE_A, b'R': MODE_R,
+    b'i': MODE_I, b'o': MODE_O, b'a': MODE_A, b'r': MODE_R,
+}
+
 
 ############################################################################
 # General file manipulation
@@ -66,11 +84,10 @@ class Files(object):
 
     def close(self, num):
         """Close a numbered file."""
-        try:
-            self.files[num].close()
+        f = self.files.get(num)
+        if f is not None:
+            f.close()
             del self.files[num]
-        except KeyError:
-            pass
 
     def close_all(self):
         """Close all files."""
@@ -104,19 +121,18 @@ class Files(object):
             self.files[number] = new_file
         return new_file
 
-    def get(self, num, mode=b'IOAR', not_open=error.BAD_FILE_NUMBER):
-        """Get the file object for a file number and check allowed mode."""
+    def get(self, num, mode=MODE_IOAR, not_open=error.BAD_FILE_NUMBER):
+        """Get the file object for a file number and check allowed mode flags."""
         if (num < 1):
             raise error.BASICError(error.BAD_FILE_NUMBER)
-        try:
-            the_file = self.files[num]
-        except KeyError:
+        the_file = self.files.get(num)
+        if the_file is None:
             raise error.BASICError(not_open)
-        if the_file.mode.upper() not in mode:
+        if not _MODE_FLAGS.get(the_file.mode, 0) & mode:
             raise error.BASICError(error.BAD_FILE_MODE)
         return the_file
 
-    def _get_from_integer(self, num, mode=b'IOAR'):
+    def _get_from_integer(self, num, mode=MODE_IOAR):
         """Get the file object for an Integer file number and check allowed mode."""
         num = values.to_int(num, unsigned=True)
         error.range_check(0, 255, num)
@@ -220,10 +236,7 @@ class Files(object):
             number = values.to_int(number)
             error.range_check(0, 255, number)
             at_least_one = True
-            try:
-                self.close(number)
-            except KeyError:
-                pass
+            self.close(number)
         # if no file number given, close everything
         if not at_least_one:
             self.close_all()
@@ -233,8 +246,8 @@ class Files(object):
         first_expr = values.next_string(args)
         if next(args):
             # old syntax
-            mode = first_expr[:1].upper()
-            if mode not in (b'I', b'O', b'A', b'R'):
+            mode = FIRST_SYNTAX_MODES.get(first_expr[:1])
+            if mode is None:
                 raise error.BASICError(error.BAD_FILE_MODE)
             number = values.to_int(next(args))
             error.range_check(0, 255, number)
@@ -274,7 +287,7 @@ class Files(object):
         number = values.to_int(next(args))
         error.range_check(0, 255, number)
         # check if file is open
-        self.get(number, b'R')
+        self.get(number, MODE_R)
         offset = 0
         try:
             while True:
@@ -304,7 +317,7 @@ class Files(object):
         """PUT: write record to file."""
         number = values.to_int(next(args))
         error.range_check(0, 255, number)
-        the_file = self.get(number, b'R', not_open=error.BAD_FILE_MODE)
+        the_file = self.get(number, MODE_R, not_open=error.BAD_FILE_MODE)
         pos, = args
         pos = self._check_pos(pos)
         the_file.put(pos)
@@ -313,7 +326,7 @@ class Files(object):
         """GET: read record from file."""
         number = values.to_int(next(args))
         error.range_check(0, 255, number)
-        the_file = self.get(number, b'R', not_open=error.BAD_FILE_MODE)
+        the_file = self.get(number, MODE_R, not_open=error.BAD_FILE_MODE)
         pos, = args
         pos = self._check_pos(pos)
         the_file.get(pos)
@@ -370,7 +383,7 @@ class Files(object):
         else:
             file_number = values.to_int(file_number)
             error.range_check(0, 255, file_number)
-            output = self.get(file_number, b'OAR')
+            output = self.get(file_number, MODE_OAR)
         outstrs = []
         try:
             while True:
@@ -397,7 +410,7 @@ class Files(object):
         elif isinstance(file_or_device, values.Number):
             file_or_device = values.to_int(file_or_device)
             error.range_check(0, 255, file_or_device)
-            dev = self.get(file_or_device, mode=b'IOAR')
+            dev = self.get(file_or_device, mode=MODE_IOAR)
             w = values.to_int(next(args))
         else:
             expr = next(args)
@@ -429,7 +442,7 @@ class Files(object):
         if file_number is not None:
             file_number = values.to_int(file_number)
             error.range_check(0, 255, file_number)
-            output = self.get(file_number, b'OAR')
+            output = self.get(file_number, MODE_OAR)
             screen = None
         else:
             # neither LPRINT not a file number: print to screen
@@ -484,7 +497,7 @@ class Files(object):
         num, = args
         num = values.to_integer(num)
         eof = self._values.new_integer()
-        if not num.is_zero() and self._get_from_integer(num, b'IR').eof():
+        if not num.is_zero() and self._get_from_integer(num, MODE_IR).eof():
             eof = eof.from_int(-1)
         return eof
 
@@ -518,7 +531,7 @@ class Files(object):
             filenum = values.to_int(filenum)
             error.range_check(0, 255, filenum)
             # raise BAD FILE MODE (not BAD FILE NUMBER) if the file is not open
-            file_obj = self.get(filenum, mode=b'IR', not_open=error.BAD_FILE_MODE)
+            file_obj = self.get(filenum, mode=MODE_IR, not_open=error.BAD_FILE_MODE)
         else:
             file_obj = self.kybd_file
         list(args)
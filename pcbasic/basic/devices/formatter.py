@@ -82,48 +82,40 @@ class Formatter(object):
         format_expr = values.next_string(args)
         if format_expr == b'':
             raise error.BASICError(error.IFC)
-        fors = codestream.CodeStream(format_expr)
+        format_tokens = _parse_format(format_expr)
         newline, format_chars = True, False
         start_cycle = True
         initial_literal = b''
+        pos = 0
         try:
             while True:
-                c = fors.peek()
-                if c == b'':
+                if pos == len(format_tokens):
                     if not format_chars:
                         # avoid infinite loop
                         break
                     # loop the format string if more variables to come
                     start_cycle = True
                     initial_literal = b''
-                    fors.seek(0)
-                elif c == b'_':
-                    # escape char; write next char in fors or _ if this is the last char
+                    pos = 0
+                    continue
+                format_field = format_tokens[pos]
+                pos += 1
+                if isinstance(format_field, bytes):
+                    # literal character
                     if start_cycle:
-                        initial_literal += fors.read(2)[-1:]
+                        initial_literal += format_field
                     else:
-                        self._output.write(fors.read(2)[-1:])
-                else:
-                    try:
-                        format_field = StringField(fors)
-                    except ValueError:
-                        try:
-                            format_field = NumberField(fors)
-                        except ValueError:
-                            if start_cycle:
-                                initial_literal += fors.read(1)
-                            else:
-                                self._output.write(fors.read(1))
-                            continue
-                    value = next(args)
-                    if value is None:
-                        newline = False
-                        break
-                    if start_cycle:
-                        self._output.write(initial_literal)
-                        start_cycle = False
-                        format_chars = True
-                    self._output.write(format_field.format(value))
+                        self._output.write(format_field)
+                    continue
+                value = next(args)
+                if value is None:
+                    newline = False
+                    break
+                if start_cycle:
+                    self._output.write(initial_literal)
+                    start_cycle = False
+                    format_chars = True
+                self._output.write(format_field.format(value))
         except StopIteration:
             pass
         if not format_chars:
@@ -136,6 +128,39 @@ class Formatter(object):
 ##############################################################################
 # formatting functions and format string parsers
 
+# parsed format strings, keyed by format string
+_format_cache = {}
+# number of parsed format strings to keep
+_FORMAT_CACHE_SIZE = 128
+
+def _parse_format(format_expr):
+    """Split a format string into a tuple of format fields and literal characters."""
+    try:
+        return _format_cache[format_expr]
+    except KeyError:
+        pass
+    fors = codestream.CodeStream(format_expr)
+    format_tokens = []
+    while True:
+        c = fors.peek()
+        if c == b'':
+            break
+        elif c == b'_':
+            # escape char; literal next char in fors or _ if this is the last char
+            format_tokens.append(fors.read(2)[-1:])
+        else:
+            try:
+                format_tokens.append(StringField(fors))
+            except ValueError:
+                try:
+                    format_tokens.append(NumberField(fors))
+                except ValueError:
+                    format_tokens.append(fors.read(1))
+    if len(_format_cache) >= _FORMAT_CACHE_SIZE:
+        _format_cache.clear()
+    format_tokens = _format_cache[format_expr] = tuple(format_tokens)
+    return format_tokens
+
 class StringField(object):
     """String Formatter for PRINT USING."""
 
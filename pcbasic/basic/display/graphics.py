@@ -257,7 +257,7 @@ class Drawing(object):
         absolute = next(args)
         # note that list() will absorb stopiteration but [] will not (in python 2)
         bounds = list(
-            int(round(values.to_single(next(args)).to_value()))
+            int(round(_to_single_value(next(args))))
             for _ in range(4)
         )
         if not bounds:
@@ -303,7 +303,7 @@ class Drawing(object):
         if self._mode.is_text_mode:
             raise error.BASICError(error.IFC)
         cartesian = not next(args)
-        coords = list(values.to_single(next(args)).to_value() for _ in range(4))
+        coords = list(_to_single_value(next(args)) for _ in range(4))
         if not coords:
             self.unset_window()
         else:
@@ -394,13 +394,12 @@ class Drawing(object):
         if self._mode.is_text_mode:
             raise error.BASICError(error.IFC)
         step = next(args)
-        x, y = (values.to_single(next(args)).to_value() for _ in range(2))
+        x, y = _to_single_value(next(args)), _to_single_value(next(args))
         c = next(args)
         if c is None:
             c = default
         else:
-            c = values.to_int(c)
-            error.range_check(0, 255, c)
+            c = _to_attribute(c)
         list(args)
         x, y = self.graph_view.coords(*self.get_window_physical(x, y, step))
         c = self.get_attr_index(c)
@@ -416,17 +415,16 @@ class Drawing(object):
             raise error.BASICError(error.IFC)
         step0 = next(args)
         x0, y0 = (
-            None if arg is None else values.to_single(arg).to_value()
+            None if arg is None else _to_single_value(arg)
             for _, arg in zip(range(2), args)
         )
         step1 = next(args)
-        x1, y1 = (values.to_single(next(args)).to_value() for _ in range(2))
+        x1, y1 = _to_single_value(next(args)), _to_single_value(next(args))
         coord0 = x0, y0, step0
         coord1 = x1, y1, step1
         c = next(args)
         if c:
-            c = values.to_int(c)
-            error.range_check(0, 255, c)
+            c = _to_attribute(c)
         shape, pattern = args
         if c is None:
             c = -1
@@ -567,21 +565,21 @@ class Drawing(object):
         if self._mode.is_text_mode:
             raise error.BASICError(error.IFC)
         step = next(args)
-        x, y = (values.to_single(next(args)).to_value() for _ in range(2))
-        r = values.to_single(next(args)).to_value()
+        x, y = _to_single_value(next(args)), _to_single_value(next(args))
+        r = _to_single_value(next(args))
         error.throw_if(r < 0)
         c = next(args)
         if c is not None:
             c = values.to_int(c)
         start = next(args)
         if start is not None:
-            start = values.to_single(start).to_value()
+            start = _to_single_value(start)
         stop = next(args)
         if stop is not None:
-            stop = values.to_single(stop).to_value()
+            stop = _to_single_value(stop)
         aspect = next(args)
         if aspect is not None:
-            aspect = values.to_single(aspect).to_value()
+            aspect = _to_single_value(aspect)
         list(args)
         x0, y0 = self.graph_view.coords(*self.get_window_physical(x, y, step))
         if c is None:
@@ -757,7 +755,7 @@ class Drawing(object):
         if self._mode.is_text_mode:
             raise error.BASICError(error.IFC)
         step = next(args)
-        x, y = (values.to_single(next(args)).to_value() for _ in range(2))
+        x, y = _to_single_value(next(args)), _to_single_value(next(args))
         coord = x, y, step
         c, pattern = -1, None
         cval = next(args)
@@ -768,12 +766,10 @@ class Drawing(object):
             error.throw_if(not pattern)
             # default for border, if pattern is specified as string: foreground attr
         elif cval is not None:
-            c = values.to_int(cval)
-            error.range_check(0, 255, c)
+            c = _to_attribute(cval)
         border = next(args)
         if border is not None:
-            border = values.to_int(border)
-            error.range_check(0, 255, border)
+            border = _to_attribute(border)
         background = next(args)
         if background is not None:
             background = values.pass_string(background, err=error.IFC).to_str()
@@ -895,7 +891,7 @@ class Drawing(object):
         """PUT: Put a sprite on the screen."""
         if self._mode.is_text_mode:
             raise error.BASICError(error.IFC)
-        x0, y0 = (values.to_single(next(args)).to_value() for _ in range(2))
+        x0, y0 = _to_single_value(next(args)), _to_single_value(next(args))
         array_name, operation_token = args
         array_name = self._memory.complete_name(array_name)
         operation_token = operation_token or tk.XOR
@@ -935,9 +931,9 @@ class Drawing(object):
         """GET: Read a sprite from the screen."""
         if self._mode.is_text_mode:
             raise error.BASICError(error.IFC)
-        x0, y0 = (values.to_single(next(args)).to_value() for _ in range(2))
+        x0, y0 = _to_single_value(next(args)), _to_single_value(next(args))
         step = next(args)
-        x, y = (values.to_single(next(args)).to_value() for _ in range(2))
+        x, y = _to_single_value(next(args)), _to_single_value(next(args))
         lcoord1 = x, y, step
         array_name, = args
         array_name = self._memory.complete_name(array_name)
@@ -1151,7 +1147,7 @@ class Drawing(object):
                 raise error.BASICError(error.IFC)
             arg1 = values.pass_number(arg1)
             list(args)
-            x, y = values.to_single(arg0).to_value(), values.to_single(arg1).to_value()
+            x, y = _to_single_value(arg0), _to_single_value(arg1)
             x, y = self.graph_view.coords(*self.get_window_physical(x, y))
             if x < 0 or x >= self._mode.pixel_width or y < 0 or y >= self._mode.pixel_height:
                 point = -1
@@ -1182,6 +1178,20 @@ class Drawing(object):
         return self._values.new_single().from_value(value)
 
 
+def _to_single_value(num):
+    """Convert a numeric value to a Python float at single precision."""
+    # integers are exact in single precision, no need to go through Single
+    if isinstance(num, values.Integer):
+        return float(num.to_int())
+    return values.to_single(num).to_value()
+
+def _to_attribute(num):
+    """Convert a numeric value to a Python int attribute, checking it is in 0--255."""
+    c = values.to_int(num)
+    error.range_check_err(0, 255, c)
+    return c
+
+
 def tile_to_interval(x0, x1, y, tile):
     """Convert a tile to a list of attributes."""
     dx = x1 - x0 + 1
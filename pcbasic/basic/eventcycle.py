@@ -87,7 +87,9 @@ class NullQueue(object):
     def put_nowait(self, item):
         pass
     def get(self, block=False, timeout=False):
-        # we're ignoring block
+        # nothing will ever arrive, so waiting just means sleeping
+        if block and timeout:
+            time.sleep(timeout)
         raise queue.Empty
     def task_done(self):
         pass
@@ -143,6 +145,18 @@ class EventQueues(object):
         time.sleep(self.tick)
         self.check_events()
 
+    def wait_input(self):
+        """Wait until an input event arrives or a tick has passed, then check events."""
+        # block on the input queue rather than sleeping, so that we wake up on a keystroke
+        try:
+            signal = self.inputs.get(True, self.tick)
+        except queue.Empty:
+            pass
+        else:
+            self.inputs.task_done()
+            self._handle_input(signal, ())
+        self.check_events()
+
     def check_events(self, event_check_input=()):
         """Main event cycle."""
         # check input first to avoid hang if the interface plugin has crashed
@@ -172,16 +186,20 @@ class EventQueues(object):
                         e.check_input(signals.Event(None))
                     break
             self.inputs.task_done()
-            # effect replacements
-            self._replace_inputs(signal)
-            # handle input events
-            for handle_input in (
-                        [self._handle_non_trappable_interrupts] +
-                        [e.check_input for e in event_check_input] +
-                        [self._handle_trappable_interrupts] +
-                        [e.check_input for e in self._handlers]):
-                if handle_input(signal):
-                    break
+            self._handle_input(signal, event_check_input)
+
+    def _handle_input(self, signal, event_check_input):
+        """Handle a single input event."""
+        # effect replacements
+        self._replace_inputs(signal)
+        # handle input events
+        for handle_input in (
+                    [self._handle_non_trappable_interrupts] +
+                    [e.check_input for e in event_check_input] +
+                    [self._handle_trappable_interrupts] +
+                    [e.check_input for e in self._handlers]):
+            if handle_input(signal):
+                break
 
     def _handle_non_trappable_interrupts(self, signal):
         """Handle non-trappable interrupts (before BASIC events)."""
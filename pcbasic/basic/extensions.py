@@ -74,8 +74,12 @@ class Extensions(object):
         self._load_extensions()
         func_name = next(args)
         func_args = list(arg.to_value() for arg in args if arg is not None)
+        func = self._ext_funcs.get(func_name)
+        if func is None:
+            logging.error(u'Could not find extension function `%s`', func_name)
+            raise error.BASICError(error.INTERNAL_ERROR)
         try:
-            result = self._ext_funcs[func_name](*func_args)
+            result = func(*func_args)
         except (error.Exit, error.Reset):
             raise
         except Exception as e:
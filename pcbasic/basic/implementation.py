@@ -20,7 +20,7 @@ from .base import error
 from .base import tokens as tk
 from .base import signals
 from .base import codestream
-from .devices import Files, InputTextFile
+from .devices import Files, InputTextFile, MODE_IR
 from . import converter
 from . import eventcycle
 from . import basicevents
@@ -720,7 +720,7 @@ class Implementation(object):
         if file_number is not None:
             file_number = values.to_int(file_number)
             error.range_check(0, 255, file_number)
-            finp = self.files.get(file_number, mode=b'IR')
+            finp = self.files.get(file_number, mode=MODE_IR)
             self._input_file(finp, args)
         else:
             newline, prompt, following = next(args)
@@ -796,7 +796,7 @@ class Implementation(object):
             prompt, newline = None, None
             file_number = values.to_int(file_number)
             error.range_check(0, 255, file_number)
-            finp = self.files.get(file_number, mode=b'IR')
+            finp = self.files.get(file_number, mode=MODE_IR)
         # get string variable
         readvar, indices = next(args)
         list(args)
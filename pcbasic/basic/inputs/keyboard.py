@@ -7,9 +7,8 @@ This file is released under the GNU GPL version 3 or later.
 """
 
 from collections import deque
-from contextlib import contextmanager
 
-from ...compat import iterchar, int2byte
+from ...compat import iterchar, int2byte, unichr
 
 from ..base import error
 from ..base import scancode
@@ -24,6 +23,7 @@ TOGGLE = {
     scancode.INSERT: 0x80, scancode.CAPSLOCK: 0x40,
     scancode.NUMLOCK: 0x20, scancode.SCROLLOCK: 0x10
 }
+CAPSLOCK_MASK = TOGGLE[scancode.CAPSLOCK]
 
 # nonsticky modifiers
 MODIFIER = {
@@ -31,6 +31,12 @@ MODIFIER = {
     scancode.LSHIFT: 0x2, scancode.RSHIFT: 0x1
 }
 
+# bit mask for all nonsticky modifiers
+MODIFIER_MASK = (
+    MODIFIER[scancode.CTRL] | MODIFIER[scancode.ALT] |
+    MODIFIER[scancode.LSHIFT] | MODIFIER[scancode.RSHIFT]
+)
+
 # default function key eascii codes for KEY autotext.
 FUNCTION_KEY = {
     ea.F1: 0, ea.F2: 1, ea.F3: 2, ea.F4: 3,
@@ -53,6 +59,7 @@ DEFAULT_MACROS = (
 
 # short beep (0.1s at 800Hz) emitted if buffer is full
 FULL_TONE = (0, 800, 0.01, False, 15)
+FULL_TONE_EVENT = signals.Event(signals.AUDIO_TONE, FULL_TONE)
 
 
 ###############################################################################
@@ -64,109 +71,123 @@ class KeyboardBuffer(object):
     def __init__(self, queues, ring_length, check_full):
         """Initialise to given length."""
         self._queues = queues
-        # buffer holds tuples (eascii/codepage, scancode, modifier)
-        self._buffer = [(b'\0\0', 0)] * ring_length
+        # ring slots hold tuples (eascii/codepage, scancode)
+        self._slots = [(b'\0\0', 0)] * ring_length
         self._ring_length = ring_length
-        self._start = ring_length
+        # ring positions of first keystroke and of next free slot
+        self._head = 0
+        self._tail = 0
+        # number of keystrokes in the ring
+        self._count = 0
+        # keystrokes that do not fit in the ring if check_full is off
+        self._overflow = deque()
         # check if ring is full
         self._check_full = check_full
 
-    @contextmanager
-    def ignore_limit(self):
-        """Enable/diable buffer limit check."""
-        save, self._check_full = self._check_full, False
-        yield
-        self._check_full = save
-
     def append(self, cp_c, scan):
         """Append a single keystroke with eascii/codepage, scancode, modifier."""
         # if check_full is off, we pretend the ring buffer is infinite
         # this is for inserting keystrokes and pasting text into the emulator
         if cp_c:
-            if self._check_full and len(self._buffer) - self._start >= self._ring_length-1:
+            if self._check_full and self._count >= self._ring_length-1:
                 # when buffer is full, GW-BASIC inserts a \r at the end but doesn't count it
-                self._buffer[self._start-1] = (b'\r', scancode.RETURN)
+                # it goes in the one free slot; if the ring is filled up, there is none
+                if self._count == self._ring_length-1:
+                    self._slots[self._tail] = (b'\r', scancode.RETURN)
                 # emit a sound signal; keystroke is dropped
-                self._queues.audio.put(signals.Event(signals.AUDIO_TONE, FULL_TONE))
+                self._queues.audio.put(FULL_TONE_EVENT)
             else:
-                self._buffer.append((cp_c, scan))
+                self._append_unchecked(cp_c, scan)
+
+    def insert(self, cp_chars):
+        """Append keystrokes given as eascii/codepage, ignoring the buffer limit."""
+        for cp_c in cp_chars:
+            if cp_c:
+                self._append_unchecked(cp_c, None)
+
+    def _append_unchecked(self, cp_c, scan):
+        """Append a single keystroke, overflowing the ring if needed."""
+        if self._count >= self._ring_length:
+            self._overflow.append((cp_c, scan))
+        else:
+            self._slots[self._tail] = (cp_c, scan)
+            self._tail = (self._tail + 1) % self._ring_length
+            self._count += 1
 
     def getc(self):
         """Read a keystroke as eascii/codepage."""
-        try:
-            c = self._buffer[self._start][0]
-        except IndexError:
-            c = b''
+        if not self._count:
+            return b''
+        c = self._slots[self._head][0]
+        if self._overflow:
+            # move the first overflowing keystroke into the freed slot
+            self._slots[self._head] = self._overflow.popleft()
+            self._tail = (self._tail + 1) % self._ring_length
         else:
-            self._start += 1
+            self._count -= 1
+        self._head = (self._head + 1) % self._ring_length
         return c
 
     def peek(self):
         """Show top keystroke in keyboard buffer as eascii/codepage."""
-        try:
-            return self._buffer[self._start][0]
-        except IndexError:
+        if not self._count:
             return b''
-
-    def _ring_index(self, index):
-        """Get index for ring position."""
-        diff = len(self._buffer) % self._ring_length - index
-        offset = len(self._buffer) - diff
-        if diff <= 0:
-            offset -= self._ring_length
-        return offset
+        return self._slots[self._head][0]
 
     @property
     def length(self):
         """Return the number of keystrokes in the buffer."""
-        return min(self._ring_length, len(self._buffer) - self._start)
+        return self._count
 
     @property
     def empty(self):
         """True if no keystrokes in buffer."""
-        return self._start >= len(self._buffer)
+        return not self._count
 
     @property
     def start(self):
         """Ring buffer starting index."""
-        return self._start % self._ring_length
+        return self._head
 
     @property
     def stop(self):
         """Ring buffer stopping index."""
-        return (self._start + self.length) % self._ring_length
+        return self._tail
+
+    def _overflow_index(self, index):
+        """Get the overflow index of the keystroke shown at a ring position, or None."""
+        # while keystrokes overflow, the ring shows the most recent ring_length of them
+        # these are the last keystrokes in the ring followed by all overflowing ones
+        overflow = len(self._overflow)
+        pos = overflow + (index - self._head - overflow) % self._ring_length - self._ring_length
+        if pos < 0:
+            return None
+        return pos
 
     def ring_read(self, index):
         """Read character at position i in ring as eascii/codepage."""
-        return self._buffer[self._ring_index(index)]
+        pos = self._overflow_index(index)
+        if pos is None:
+            return self._slots[index]
+        return self._overflow[pos]
 
     def ring_write(self, index, c, scan):
         """Write character at position i in ring as eascii/codepage."""
-        self._buffer[self._ring_index(index)] = (c, scan)
+        pos = self._overflow_index(index)
+        if pos is None:
+            self._slots[index] = (c, scan)
+        else:
+            self._overflow[pos] = (c, scan)
 
     def ring_set_boundaries(self, newstart, newstop):
         """Set start and stop index."""
-        length = (newstop - newstart) % self._ring_length
-        # rotate buffer to account for new start and stop
-        # these are between length - ring_length and length
-        start_index = self._ring_index(newstart)
-        stop_index = self._ring_index(newstop)
-        start = self._ring_index(self._start)
-        # drop any extended buffer beyond ring limits
-        self._buffer = self._buffer[:self._start + self._ring_length]
-        # cut to ring limits, we should be exactly the right size
-        start -= len(self._buffer) - self._ring_length
-        self._buffer = self._buffer[-self._ring_length:]
-        # rotate so that the stop index is at the end
-        shift = len(self._buffer[start+length:])
-        self._buffer = self._buffer[start+length:] + self._buffer[:start+length]
-        start += shift
-        start = start % self._ring_length
-        # insert zeros before buffer to get the correct modulo
-        while start % self._ring_length != newstart:
-            start += 1
-            self._buffer = [(b'\0\0', 0)] + self._buffer
-        self._start = start
+        if self._overflow:
+            # keep the keystrokes shown in the ring, drop any extended buffer beyond ring limits
+            self._slots = [self.ring_read(_i) for _i in range(self._ring_length)]
+            self._overflow.clear()
+        self._head = newstart % self._ring_length
+        self._tail = newstop % self._ring_length
+        self._count = (self._tail - self._head) % self._ring_length
 
 
 ###############################################################################
@@ -174,14 +195,18 @@ class KeyboardBuffer(object):
 
 def _split_eascii(cp_s):
     """Split a string of e-ascii/codepage into keystrokes."""
-    d = b''
-    for c in iterchar(cp_s):
-        if d or c != b'\0':
-            yield d + c
-            d = b''
-        elif c == b'\0':
-            # eascii code is \0 plus one char
-            d = c
+    keys = []
+    start = 0
+    while True:
+        nul = cp_s.find(b'\0', start)
+        if nul < 0:
+            keys.extend(iterchar(cp_s[start:]))
+            return keys
+        keys.extend(iterchar(cp_s[start:nul]))
+        # eascii code is \0 plus one char; a trailing \0 is dropped
+        if nul + 1 < len(cp_s):
+            keys.append(cp_s[nul:nul+2])
+        start = nul + 2
 
 
 class Keyboard(object):
@@ -198,25 +223,27 @@ class Keyboard(object):
         self.last_scancode = 0
         # active status of caps, num, scroll, alt, ctrl, shift modifiers
         self.mod = 0
-        # store for alt+keypad ascii insertion
-        self.keypad_ascii = b''
+        # store for alt+keypad ascii insertion; list of digits
+        self.keypad_ascii = []
         # ignore caps lock, let OS handle it
         # this is now switched off hard-coded, but logic remains for now
         self._ignore_caps = True
         # pre-inserted keystrings
         self._codepage = codepage
-        with self.buf.ignore_limit():
-            for ea_char in _split_eascii(self._codepage.str_from_unicode(keystring)):
-                self.buf.append(ea_char, None)
+        # memo of codepage sequences for keystrokes seen before
+        self._cp_keys = {}
+        self.buf.insert(_split_eascii(self._codepage.str_from_unicode(keystring)))
         # stream buffer
         self._stream_buffer = deque()
         # redirected input stream has closed
         self._input_closed = False
         # expansion buffer for keyboard macros
         # expansion vessel holds codepage chars
-        self._expansion_vessel = []
+        self._expansion_vessel = deque()
         # f-key macros
         self._key_replace = list(DEFAULT_MACROS)
+        # f-key macros split into codepage chars, ready for expansion
+        self._key_replace_chars = [tuple(iterchar(_macro)) for _macro in DEFAULT_MACROS]
 
     # event handler
 
@@ -244,54 +271,50 @@ class Keyboard(object):
             self.last_scancode = scan
         # update ephemeral modifier status at every keypress
         # mods is a list of scancodes; OR together the known modifiers
-        self.mod &= ~(
-            MODIFIER[scancode.CTRL] | MODIFIER[scancode.ALT] |
-            MODIFIER[scancode.LSHIFT] | MODIFIER[scancode.RSHIFT]
-        )
+        mod = self.mod & ~MODIFIER_MASK
         if mods:
             for m in mods:
-                self.mod |= MODIFIER.get(m, 0)
+                mod |= MODIFIER.get(m, 0)
         # set toggle-key modifier status
         # these are triggered by keydown events
-        try:
-            self.mod ^= TOGGLE[scan]
-        except KeyError:
-            pass
+        self.mod = mod ^ TOGGLE.get(scan, 0)
         # alt+keypad ascii replacement
         if mods and (scancode.ALT in mods):
-            try:
-                self.keypad_ascii += KEYPAD[scan]
+            digit = KEYPAD.get(scan)
+            if digit:
+                self.keypad_ascii.append(digit)
                 return
-            except KeyError:
-                pass
-        if (
-                self.mod & TOGGLE[scancode.CAPSLOCK]
-                and not self._ignore_caps and len(c) == 1
-            ):
-            c = c.swapcase()
-        self.buf.append(self._codepage.from_unicode(c), scan)
+        if not self._ignore_caps and (self.mod & CAPSLOCK_MASK) and len(c) == 1:
+            if u'A' <= c <= u'Z' or u'a' <= c <= u'z':
+                # ascii letters differ in case by bit 5
+                c = unichr(ord(c) ^ 0x20)
+            elif c >= u'\x80':
+                c = c.swapcase()
+        try:
+            cp_c = self._cp_keys[c]
+        except KeyError:
+            cp_c = self._codepage.from_unicode(c)
+            if len(self._cp_keys) < 256:
+                self._cp_keys[c] = cp_c
+        self.buf.append(cp_c, scan)
 
     def _key_up(self, scan):
         """Insert a key-up event."""
         if scan is not None:
             self.last_scancode = 0x80 + scan
-        try:
-            # switch off ephemeral modifiers
-            self.mod &= ~MODIFIER[scan]
-        except KeyError:
-           pass
+        # switch off ephemeral modifiers
+        self.mod &= ~MODIFIER.get(scan, 0)
         # ALT+keycode
         if scan == scancode.ALT and self.keypad_ascii:
-            char = int2byte(int(self.keypad_ascii)%256)
+            char = int2byte(int(b''.join(self.keypad_ascii))%256)
             if char == b'\0':
                 char = b'\0\0'
             self.buf.append(char, None)
-            self.keypad_ascii = b''
+            self.keypad_ascii = []
 
     def _stream_chars(self, us):
         """Insert eascii/unicode string into stream buffer."""
-        for ea_char in _split_eascii(self._codepage.str_from_unicode(us)):
-            self._stream_buffer.append(ea_char)
+        self._stream_buffer.extend(_split_eascii(self._codepage.str_from_unicode(us)))
 
     def _close_input(self):
         """Signal that input stream has closed."""
@@ -304,6 +327,7 @@ class Keyboard(object):
         # NUL terminates macro string, rest is ignored
         # macro starting with NUL is empty macro
         self._key_replace[num-1] = macro.split(b'\0', 1)[0]
+        self._key_replace_chars[num-1] = tuple(iterchar(self._key_replace[num-1]))
 
     def get_macro(self, num):
         """Get macro for given function key."""
@@ -321,29 +345,30 @@ class Keyboard(object):
                     keyboard_only or (not self._input_closed and not self._stream_buffer)
                 )
             ):
-            self._queues.wait()
+            self._queues.wait_input()
 
     def _read_byte(self, expand=True):
         """Read one byte from keyboard buffer, expanding macros if required."""
-        try:
-            return self._expansion_vessel.pop(0)
-        except IndexError:
-            pass
+        if self._expansion_vessel:
+            return self._expansion_vessel.popleft()
         c = self.buf.getc()
-        if not expand or c not in FUNCTION_KEY:
+        if not expand:
             return c
-        # function key macro expansion
-        self._expansion_vessel = list(iterchar(self._key_replace[FUNCTION_KEY[c]]))
-        try:
-            return self._expansion_vessel.pop(0)
-        except IndexError:
-            # function macro has been redefined as empty: return scancode
-            # e.g. KEY 1, "" enables catching F1 with INKEY$
+        fkey = FUNCTION_KEY.get(c)
+        if fkey is None:
             return c
+        # function key macro expansion
+        self._expansion_vessel = deque(self._key_replace_chars[fkey])
+        if self._expansion_vessel:
+            return self._expansion_vessel.popleft()
+        # function macro has been redefined as empty: return scancode
+        # e.g. KEY 1, "" enables catching F1 with INKEY$
+        return c
 
     def inkey_(self, args):
         """INKEY$: read one byte from keyboard or stream; nonblocking."""
-        list(args)
+        # exhaust the argument iterator without storing anything
+        deque(args, maxlen=0)
         # wait a tick to reduce load in loops
         self._queues.wait()
         inkey = self._read_byte() or (self._stream_buffer.popleft() if self._stream_buffer else b'')
@@ -364,14 +389,14 @@ class Keyboard(object):
 
     def get_fullchar(self, expand=True):
         """Read one (sbcs or dbcs) full character; nonblocking."""
+        lead, trail = self._codepage.lead, self._codepage.trail
         c = self._read_byte(expand)
         # insert dbcs chars from keyboard buffer two bytes at a time
-        if (c in self._codepage.lead and self.buf.peek() in self._codepage.trail):
+        if (c in lead and self.buf.peek() in trail):
             c += self._read_byte(expand)
         if not c and self._stream_buffer:
             c = self._stream_buffer.popleft()
-            if (c in self._codepage.lead and self._stream_buffer and
-                        self._stream_buffer[0] in self._codepage.trail):
+            if (c in lead and self._stream_buffer and self._stream_buffer[0] in trail):
                 c += self._stream_buffer.popleft()
         return c
 
@@ -15,6 +15,14 @@ from .base import codestream
 from . import values
 
 
+# bytes allowed after a statement, other than a line ending
+_STATEMENT_SEPARATORS = set((b':', tk.THEN, tk.ELSE, tk.GOTO))
+# bytes ending an unquoted string item in DATA
+_DATA_STRING_END = set((b',', b'"') + tk.END_STATEMENT)
+# bytes allowed after an item in DATA
+_DATA_ITEM_END = set(tk.END_STATEMENT + (b',',))
+
+
 class Interpreter(object):
     """BASIC interpreter."""
 
@@ -103,7 +111,7 @@ class Interpreter(object):
                         linenum = struct.unpack_from('<H', token, 2)
                         self._screen.write(b'[%i]' % linenum)
                     self.step(token)
-                elif c not in (b':', tk.THEN, tk.ELSE, tk.GOTO):
+                elif c not in _STATEMENT_SEPARATORS:
                     # new statement or branch of an IF statement allowed, nothing else
                     raise error.BASICError(error.STX)
                 self.parser.parse_statement(ins)
@@ -342,7 +350,7 @@ class Interpreter(object):
     def on_jump_(self, args):
         """ON GOTO/GOSUB: calculated jump."""
         onvar = values.to_int(next(args))
-        error.range_check(0, 255, onvar)
+        error.range_check_err(0, 255, onvar)
         jump_type = next(args)
         # only parse jumps (and errors!) up to our choice
         i = -1
@@ -425,16 +433,18 @@ class Interpreter(object):
         # record the location after the variable
         pos = ins.tell()
         # find the matching NEXT record
-        num = len(self.for_stack)
-        for depth in range(num):
-            varname2, stop, step, sgn, forpos, nextpos = self.for_stack[-depth-1]
+        for_stack = self.for_stack
+        for depth in range(len(for_stack)):
+            varname2, stop, step, sgn, forpos, nextpos = for_stack[-depth-1]
             if pos == nextpos:
                 if varname is not None and varname2 != self._memory.complete_name(varname):
                     # check once more for matches
                     # it has been checked at FOR, but DEFtypes may have changed.
                     raise error.BASICError(error.NEXT_WITHOUT_FOR)
                 # only drop NEXT record if we've found a matching one
-                self.for_stack = self.for_stack[:len(self.for_stack)-depth]
+                # drop inner records in place, rather than copying the stack on every NEXT
+                if depth:
+                    del for_stack[-depth:]
                 break
         else:
             raise error.BASICError(error.NEXT_WITHOUT_FOR)
@@ -444,7 +454,7 @@ class Interpreter(object):
         # check condition
         loop_ends = counter_view.gt(stop) if sgn > 0 else stop.gt(counter_view)
         if loop_ends:
-            self.for_stack.pop()
+            for_stack.pop()
         else:
             ins.seek(forpos)
         return not loop_ends
@@ -533,7 +543,7 @@ class Interpreter(object):
             if name[-1:] == values.STR:
                 # for unquoted strings, payload starts at the first non-empty character
                 address = self._program_code.tell_address()
-                word = self._program_code.read_to((b',', b'"',) + tk.END_STATEMENT)
+                word = self._program_code.read_to(_DATA_STRING_END)
                 if self._program_code.peek() == b'"':
                     if word == b'':
                         # nothing before the quotes, so this is a quoted string literal
@@ -543,7 +553,7 @@ class Interpreter(object):
                     else:
                         # complete unquoted string literal
                         word += self._program_code.read_string()
-                    if (self._program_code.skip_blank() not in (tk.END_STATEMENT + (b',',))):
+                    if (self._program_code.skip_blank() not in _DATA_ITEM_END):
                         raise error.BASICError(error.STX)
                 else:
                     word = word.strip(self._program_code.blanks)
@@ -554,7 +564,7 @@ class Interpreter(object):
                     word = b''
                 value = self._values.from_repr(word, allow_nonnum=False)
                 # anything after the number is a syntax error, but assignment has taken place)
-                if (self._program_code.skip_blank() not in (tk.END_STATEMENT + (b',',))):
+                if (self._program_code.skip_blank() not in _DATA_ITEM_END):
                     data_error = True
             # restore to current program location
             # to ensure any other errors in set_variable get the correct line number
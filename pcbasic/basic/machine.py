@@ -587,7 +587,7 @@ class Memory(object):
         elif addr == 1048:
             return 0
         elif addr == 1049:
-            return int(self.keyboard.keypad_ascii or 0)%256
+            return int(b''.join(self.keyboard.keypad_ascii) or 0)%256
         elif addr == 1050:
             # keyboard ring buffer starts at n+1024; lowest 1054
             return (self.keyboard.buf.start*2 + self.key_buffer_offset) % 256
@@ -46,6 +46,12 @@ class Arrays(object):
         self._dims = {}
         self._buffers = {}
         self._cache = {}
+        # record and buffer sizes in bytes, fixed at allocation
+        self._sizes = {}
+        # memory representation of the record after the name
+        self._headers = {}
+        # flat index step for each subscript
+        self._strides = {}
         self._array_memory = {}
         self.current = 0
 
@@ -56,14 +62,16 @@ class Arrays(object):
             if name not in self._dims:
                 # IFC if array does not exist
                 raise error.BASICError(error.IFC)
-            dimensions = self._dims[name]
-            record_len = 1 + max(3, len(name)) + 3 + 2*len(dimensions)
-            freed_bytes = self.array_len(dimensions) * values.size_bytes(name) + record_len
+            record_len, array_bytes = self._sizes[name]
+            freed_bytes = record_len + array_bytes
             erased_name_ptr, _ = self._array_memory[name]
             # delete buffers
             del self._dims[name]
             del self._buffers[name]
             del self._cache[name]
+            del self._sizes[name]
+            del self._headers[name]
+            del self._strides[name]
             del self._array_memory[name]
             # update memory model
             for name in self._array_memory:
@@ -82,6 +90,20 @@ class Arrays(object):
             area *= dimensions[i] + 1 - self._base
         return bigindex
 
+    def _flat_index(self, name, index):
+        """Return the flat index for a checked index into an allocated array."""
+        base = self._base
+        # unroll the common one- and two-dimensional cases
+        if len(index) == 1:
+            return index[0] - base
+        strides = self._strides[name]
+        if len(index) == 2:
+            return index[0] - base + strides[1] * (index[1] - base)
+        bigindex = 0
+        for i, stride in zip(index, strides):
+            bigindex += stride * (i - base)
+        return bigindex
+
     def array_len(self, dimensions):
         """Return the flat length for given dimensioned size."""
         return self.index(dimensions, dimensions) + 1
@@ -89,10 +111,9 @@ class Arrays(object):
     def array_size_bytes(self, name):
         """Return the byte size of an array, if it exists. Return 0 otherwise."""
         try:
-            dimensions = self._dims[name]
+            return self._sizes[name][1]
         except KeyError:
             return 0
-        return self.array_len(dimensions) * values.size_bytes(name)
 
     def view_full_buffer(self, name):
         """Return a memoryview to a full array."""
@@ -156,10 +177,23 @@ class Arrays(object):
         self._memory.check_free(total_bytes, error.OUT_OF_MEMORY)
         self.current += total_bytes
         self._array_memory[name] = (name_ptr, array_ptr)
+        self._sizes[name] = (record_len, array_bytes)
+        self._headers[name] = self._header(dimensions, array_bytes)
+        strides = [1]
+        for d in dimensions[:-1]:
+            strides.append(strides[-1] * (d + 1 - self._base))
+        self._strides[name] = strides
         self._buffers[name] = bytearray(array_bytes)
         self._dims[name] = dimensions
         self._cache[name] = None
 
+    def _header(self, dimensions, array_bytes):
+        """Build memory representation of array record after the name."""
+        header = bytearray(struct.pack('<HB', array_bytes + 1 + 2*len(dimensions), len(dimensions)))
+        for d in dimensions:
+            header += struct.pack('<H', d + 1 - self._base)
+        return header
+
     def check_dim(self, name, index):
         """
         Check if an array has been allocated.
@@ -175,11 +209,13 @@ class Arrays(object):
         lst = self._buffers[name]
         if len(index) != len(dimensions):
             raise error.BASICError(error.SUBSCRIPT_OUT_OF_RANGE)
+        base = self._base
         for i, d in zip(index, dimensions):
-            if i < 0:
-                raise error.BASICError(error.IFC)
-            elif i < self._base or i > d:
-                # dimensions is the *maximum index number*, regardless of self._base
+            # dimensions is the *maximum index number*, regardless of self._base
+            # base is 0 or 1, so a negative index also fails this single test
+            if not base <= i <= d:
+                if i < 0:
+                    raise error.BASICError(error.IFC)
                 raise error.BASICError(error.SUBSCRIPT_OUT_OF_RANGE)
         return dimensions, lst
 
@@ -199,7 +235,7 @@ class Arrays(object):
     def view_buffer(self, name, index):
         """Return a memoryview to an array element."""
         dimensions, lst = self.check_dim(name, index)
-        bigindex = self.index(index, dimensions)
+        bigindex = self._flat_index(name, index)
         bytesize = values.size_bytes(name)
         return memoryview(lst)[bigindex*bytesize:(bigindex+1)*bytesize]
 
@@ -268,15 +304,7 @@ class Arrays(object):
                 return get_name_in_memory(the_arr, offset)
             else:
                 offset -= max(3, len(the_arr))+1
-                dimensions = self._dims[the_arr]
-                data_rep = struct.pack(
-                    '<HB',
-                    self.array_size_bytes(the_arr) + 1 + 2*len(dimensions),
-                    len(dimensions)
-                )
-                for d in dimensions:
-                    data_rep += struct.pack('<H', d + 1 - self._base)
-                return data_rep[offset]
+                return self._headers[the_arr][offset]
 
     def get_strings(self):
         """Return a list of views of string array elements."""
@@ -80,6 +80,30 @@ class Field(object):
         self._memory.set_variable(name, indices, self._memory.values.from_bytes(str_sequence))
 
 
+############################################################################
+# temporary value stacks
+
+class TempStacks(object):
+    """Context manager providing a new temporary value stack on each entry."""
+
+    def __init__(self):
+        """Set up empty list of stacks."""
+        self.stacks = []
+
+    def __enter__(self):
+        """Push and return a (mutable) deque to use as stack."""
+        stack = deque()
+        self.stacks.append(stack)
+        return stack
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Drop the innermost stack."""
+        self.stacks.pop()
+
+
+############################################################################
+# data segment
+
 class DataSegment(object):
     """Memory model."""
 
@@ -111,6 +135,8 @@ class DataSegment(object):
         self.code_start = self._field_mem_base + (max_files+1) * self._field_mem_offset
         # default sigils for names
         self.deftype = [values.SNG]*26
+        # names completed with their default sigil; must be reset when deftype changes
+        self._complete_names = {}
         # string space
         self.strings = values.StringSpace(self)
         # prepare string and number handler
@@ -120,7 +146,7 @@ class DataSegment(object):
         # array space
         self.arrays = arrays.Arrays(self, self.values)
         # temporary values
-        self._stack = []
+        self._temp_stacks = TempStacks()
         # FIELD buffers
         self.max_files = max_files
         self.max_reclen = max_reclen
@@ -144,16 +170,14 @@ class DataSegment(object):
         for field in self.fields.values():
             field.clear()
 
-    @contextmanager
     def get_stack(self):
-        """Reset temporary variables and return a (mutable) deque to use as stack."""
-        self._stack.append(deque())
-        yield self._stack[-1]
-        self._stack.pop()
+        """Context manager returning a new (mutable) deque to use as stack."""
+        return self._temp_stacks
 
     def clear_deftype(self):
         """Reset default sigils."""
         self.deftype = [values.SNG]*26
+        self._complete_names = {}
 
     def deftype_(self, sigil, args):
         """DEFSTR/DEFINT/DEFSNG/DEFDBL: set type defaults for variables."""
@@ -164,6 +188,7 @@ class DataSegment(object):
             else:
                 stop = start
             self.deftype[start:stop+1] = [sigil] * (stop-start+1)
+        self._complete_names = {}
 
     def defint_(self, args):
         """Set default integer variables."""
@@ -281,7 +306,7 @@ class DataSegment(object):
         if not self._allow_collect:
             return
         # find all strings that are actually referenced
-        stack_strings = [value.view() for stack in self._stack for value in stack if isinstance(value, values.String)]
+        stack_strings = [value.view() for stack in self._temp_stacks.stacks for value in stack if isinstance(value, values.String)]
         string_ptrs = self.scalars.get_strings() + self.arrays.get_strings() + stack_strings
         self.strings.collect_garbage(string_ptrs)
 
@@ -444,9 +469,15 @@ class DataSegment(object):
 
     def complete_name(self, name):
         """Add default sigil to a name, if missing."""
+        try:
+            return self._complete_names[name]
+        except KeyError:
+            pass
+        complete = name
         if name and name[-1:] not in tk.SIGILS:
-            name += self.deftype[bytearray(name.upper())[0] - ord(b'A')]
-        return name
+            complete = name + self.deftype[bytearray(name.upper())[0] - ord(b'A')]
+        self._complete_names[name] = complete
+        return complete
 
     def view_or_create_variable(self, name, indices):
         """Retrieve the value of a scalar variable or an array element."""
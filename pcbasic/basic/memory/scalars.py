@@ -7,6 +7,7 @@ This file is released under the GNU GPL version 3 or later.
 """
 
 import struct
+from bisect import bisect_right
 
 from ...compat import iteritems, iterkeys
 
@@ -41,6 +42,9 @@ class Scalars(object):
         """Clear scalar variables."""
         self._vars = {}
         self._var_memory = {}
+        # name pointers in order of allocation, which is increasing address order
+        self._name_ptrs = []
+        self._names = []
         self.current = 0
 
     @staticmethod
@@ -78,6 +82,8 @@ class Scalars(object):
             var_ptr = name_ptr + self._record_size(name)
             self.current += size
             self._var_memory[name] = (name_ptr, var_ptr)
+            self._name_ptrs.append(name_ptr)
+            self._names.append(name)
         # don't change the value if just checking allocation
         if value is None:
             if name in self._vars:
@@ -122,16 +128,12 @@ class Scalars(object):
 
     def get_memory(self, address):
         """Retrieve data from data memory: variable space """
-        name_addr = -1
-        var_addr = -1
-        the_var = None
-        for name in self._var_memory:
-            name_try, var_try = self._var_memory[name]
-            if name_try <= address and name_try > name_addr:
-                name_addr, var_addr = name_try, var_try
-                the_var = name
-        if the_var is None:
+        # find the last variable record starting at or before the address
+        index = bisect_right(self._name_ptrs, address) - 1
+        if index < 0:
             return -1
+        the_var = self._names[index]
+        name_addr, var_addr = self._var_memory[the_var]
         if address >= var_addr:
             offset = address - var_addr
             if offset >= values.size_bytes(the_var):
@@ -13,6 +13,10 @@ from .base.tokens import DIGITS
 from . import values
 
 
+# digit characters; unlike DIGITS, this does not contain the empty string
+_DIGITS = set(iterchar(DIGITS))
+
+
 class MLParser(codestream.CodeStream):
     """Macro Language parser."""
 
@@ -79,7 +83,7 @@ class MLParser(codestream.CodeStream):
     def _parse_const(self):
         """Parse and return a constant value in a macro-language string."""
         numstr = b''
-        while self.skip_blank() in set(iterchar(DIGITS)):
+        while self.skip_blank() in _DIGITS:
             numstr += self.read(1)
         try:
             return int(numstr)
@@ -91,7 +95,7 @@ class MLParser(codestream.CodeStream):
         indices = []
         if self.skip_blank_read_if((b'[', b'(')):
             while True:
-                if self.skip_blank() in set(iterchar(DIGITS)):
+                if self.skip_blank() in _DIGITS:
                     indices.append(self._parse_const())
                 else:
                     indices.append(self._parse_variable().to_int())
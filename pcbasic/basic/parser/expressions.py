@@ -21,6 +21,12 @@ from . import operators as op
 from . import userfunctions
 
 
+# number literal tokens
+_NUMBER_TOKENS = set(tk.NUMBER)
+# bytes that end an expression
+_END_EXPRESSION = set(tk.END_EXPRESSION)
+
+
 class ExpressionParser(object):
     """Expression parser."""
 
@@ -237,6 +243,13 @@ class ExpressionParser(object):
 
     def parse(self, ins):
         """Parse and evaluate tokenised (sub-)expression."""
+        # shortcut for a lone number literal, such as the arguments in SCREEN 1,0
+        if ins.skip_blank() in _NUMBER_TOKENS:
+            pos = ins.tell()
+            token = ins.read_number_token()
+            if ins.skip_blank() in _END_EXPRESSION:
+                return self._values.from_token(token)
+            ins.seek(pos)
         operations = deque()
         with self._memory.get_stack() as units:
             final = True
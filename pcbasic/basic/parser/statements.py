@@ -7,10 +7,8 @@ This file is released under the GNU GPL version 3 or later.
 """
 
 import logging
-import struct
-from functools import partial
 
-from ...compat import iterchar
+from ...compat import iterchar, iteritems
 from ..base import error
 from ..base import tokens as tk
 from ..base.tokens import DIGITS, LETTERS
@@ -19,9 +17,73 @@ from . import expressions
 from . import userfunctions
 
 
+# leading bytes of an implicit LET; letter ranges for DEFINT etc.
+_LETTERS = set(iterchar(LETTERS))
+# leading bytes of a number literal
+_NUMBER_START = set(iterchar(DIGITS)) | set(tk.NUMBER)
+# statements with ON/OFF/STOP event switches
+_EVENTS = (tk.PEN, tk.KEY, tk.TIMER, tk.PLAY, tk.COM, tk.STRIG)
+_PAREN_STEP = (b'(', tk.STEP)
+# opening brackets of array indices
+_INDEX_OPEN = (b'[', b'(')
+# sets for membership tests on the byte after a statement keyword
+_END_STATEMENT = set(tk.END_STATEMENT)
+_END_STATEMENT_COMMA = _END_STATEMENT | set((b',',))
+_END_EXPRESSION = set(tk.END_EXPRESSION)
+_PRINT_SEPARATORS = set((b',', b';'))
+_SPC_TAB = set((tk.SPC, tk.TAB))
+_END_STATEMENT_IF = tk.END_STATEMENT + (tk.IF,)
+# mode words in OPEN ... FOR, other than INPUT
+_OPEN_FOR_MODES = {tk.W_OUTPUT: b'O', tk.W_RANDOM: b'R', tk.W_APPEND: b'A'}
+
+# token tuples for require_read and skip_blank_read_if
+_ACCESS = (tk.W_ACCESS,)
+_ALL = (tk.W_ALL,)
+_AS = (tk.W_AS,)
+_BASE = (tk.W_BASE,)
+_DELETE = (tk.DELETE,)
+_ELSE = (tk.ELSE,)
+_EQ = (tk.O_EQ,)
+_ERROR = (tk.ERROR,)
+_FN = (tk.FN,)
+_FOR = (tk.FOR,)
+_GOSUB = (tk.GOSUB,)
+_GOTO = (tk.GOTO,)
+_GOTO_GOSUB = (tk.GOTO, tk.GOSUB)
+_HASH_LPRINT = (b'#', tk.LPRINT)
+_INPUT = (tk.INPUT,)
+_LEN = (tk.LEN,)
+_LOCK = (tk.LOCK,)
+_MERGE = (tk.MERGE,)
+_MINUS = (tk.O_MINUS,)
+_ON_OFF = (tk.ON, tk.OFF)
+_ON_OFF_STOP = (tk.ON, tk.OFF, tk.STOP)
+_PRINT = (tk.PRINT,)
+_PUT_ACTIONS = (tk.PSET, tk.PRESET, tk.AND, tk.OR, tk.XOR)
+_READ_WRITE = (tk.READ, tk.WRITE)
+_SCREEN = (tk.SCREEN,)
+_SEG = (tk.W_SEG,)
+_SHARED = (tk.W_SHARED,)
+_STEP = (tk.STEP,)
+_THEN_GOTO = (tk.THEN, tk.GOTO)
+_TO = (tk.TO,)
+_T_UINT = (tk.T_UINT,)
+_USING = (tk.USING,)
+_USR = (tk.USR,)
+_WRITE = (tk.WRITE,)
+
+
 class Parser(object):
     """BASIC statement parser."""
 
+    # state that is pickled
+    _pickled = ('redo_on_break', 'expression_parser', 'user_functions', '_syntax')
+    # syntax tables and callbacks, rebuilt after unpickling
+    __slots__ = _pickled + (
+        '_pcjr_syntax', '_simple', '_complex', '_table', '_table2',
+        '_evaluate', '_callbacks',
+    )
+
     def __init__(self, values, memory, syntax):
         """Initialise statement context."""
         # re-execute current statement after Break
@@ -31,21 +93,23 @@ class Parser(object):
         self.user_functions = self.expression_parser.user_functions
         # syntax: advanced, pcjr, tandy
         self._syntax = syntax
+        # statement callbacks and dispatch tables are set by init_callbacks
+        self._callbacks = None
+        self._table, self._table2 = None, None
         # initialise syntax parser tables
         self._init_syntax()
 
     def __getstate__(self):
         """Pickle."""
-        pickle_dict = self.__dict__.copy()
-        # can't be pickled
-        pickle_dict['_simple'] = None
-        pickle_dict['_complex'] = None
-        pickle_dict['_callbacks'] = None
-        return pickle_dict
+        # syntax tables and callbacks can't be pickled
+        return {name: getattr(self, name) for name in self._pickled}
 
     def __setstate__(self, pickle_dict):
         """Unpickle."""
-        self.__dict__.update(pickle_dict)
+        for name, value in iteritems(pickle_dict):
+            setattr(self, name, value)
+        self._callbacks = None
+        self._table, self._table2 = None, None
         self._init_syntax()
 
     def init_callbacks(self, session):
@@ -58,28 +122,27 @@ class Parser(object):
         # read keyword token or one byte
         ins.skip_blank()
         c = ins.read_keyword_token()
-        if c in self._simple:
-            parse_args = self._simple[c]
-        elif c in self._complex:
-            stat_dict = self._complex[c]
+        if len(c) == 1:
+            entry = self._table[ord(c)]
+        else:
+            entry = self._table2.get(c)
+        if type(entry) is dict:
+            # statement syntax depends on the next token
             ins.skip_blank()
             selector = ins.read_keyword_token()
             ins.seek(-len(selector), 1)
-            if selector not in stat_dict.keys():
-                selector = None
-            else:
-                c += selector
-            parse_args = stat_dict[selector]
-        else:
+            stat_dict, entry = entry, entry.get(selector)
+            if entry is None:
+                entry = stat_dict[None]
+        elif entry is None:
+            # not a statement keyword: an empty statement, or a syntax error
+            # c may be empty at the end of the code or a two-byte token
             ins.seek(-len(c), 1)
-            if c in set(iterchar(LETTERS)):
-                # implicit LET
-                c = tk.LET
-                parse_args = self._simple[tk.LET]
-            else:
-                ins.require_end()
-                return
-        self._callbacks[c](parse_args(ins))
+            if c not in _END_STATEMENT:
+                raise error.BASICError(error.STX)
+            return
+        parse_args, callback = entry
+        callback(parse_args(ins))
         # end-of-statement is checked at start of next statement in interpreter loop
 
     def parse_name(self, ins):
@@ -92,10 +155,10 @@ class Parser(object):
 
     def parse_expression(self, ins, allow_empty=False):
         """Compute the value of the expression at the current code pointer."""
-        if allow_empty and ins.skip_blank() in tk.END_EXPRESSION:
+        if allow_empty and ins.skip_blank() in _END_EXPRESSION:
             return None
         self.redo_on_break = True
-        val = self.expression_parser.parse_expression(ins)
+        val = self._evaluate(ins)
         self.redo_on_break = False
         return val
 
@@ -103,6 +166,10 @@ class Parser(object):
 
     def _init_syntax(self):
         """Initialise syntax parsers."""
+        # PCjr and Tandy statement extensions
+        self._pcjr_syntax = self._syntax in ('pcjr', 'tandy')
+        # expression evaluator, called for nearly every statement
+        self._evaluate = self.expression_parser.parse_expression
         self._simple = {
             tk.DATA: self._skip_statement,
             tk.COMMON: self._skip_statement,
@@ -130,13 +197,13 @@ class Parser(object):
             tk.RESTORE: self._parse_restore,
             tk.GOSUB: self._parse_single_line_number,
             tk.RETURN: self._parse_optional_line_number,
-            tk.PRINT: partial(self._parse_print, parse_file=True),
+            tk.PRINT: self._parse_print,
             tk.CLEAR: self._parse_clear,
             tk.LIST: self._parse_list,
             tk.WAIT: self._parse_wait,
             tk.POKE: self._parse_two_args,
             tk.OUT: self._parse_two_args,
-            tk.LPRINT: partial(self._parse_print, parse_file=False),
+            tk.LPRINT: self._parse_lprint,
             tk.LLIST: self._parse_delete_llist,
             tk.WIDTH: self._parse_width,
             tk.SWAP: self._parse_swap,
@@ -201,7 +268,7 @@ class Parser(object):
             tk.PEN: self._parse_event_command,
             b'_': self._parse_call_extension,
         }
-        if self._syntax in ('pcjr', 'tandy'):
+        if self._pcjr_syntax:
             self._simple.update({
                 tk.TERM: self._parse_end,
                 tk.NOISE: self._parse_noise,
@@ -261,6 +328,9 @@ class Parser(object):
                 None: self._parse_com_command,
             },
         }
+        # a leading letter starts an implicit LET
+        for letter in _LETTERS:
+            self._simple[letter] = self._parse_implicit_let
 
     def init_statements(self, session):
         """Initialise statement callbacks."""
@@ -397,6 +467,30 @@ class Parser(object):
             tk.STRIG: session.basic_events.strig_,
             b'_': session.extensions.call_as_statement,
         }
+        for letter in _LETTERS:
+            self._callbacks[letter] = session.memory.let_
+        self._init_dispatch()
+
+    def _init_dispatch(self):
+        """Build dispatch tables pairing syntax parsers with callbacks."""
+        # entries are a (parser, callback) pair or a dict of pairs by next token
+        dispatch = {
+            token: (parse_args, self._callbacks[token])
+            for token, parse_args in iteritems(self._simple)
+        }
+        for token, stat_dict in iteritems(self._complex):
+            dispatch[token] = {
+                selector: (parse_args, self._callbacks[token + (selector or b'')])
+                for selector, parse_args in iteritems(stat_dict)
+            }
+        # one-byte tokens are indexed by byte value, two-byte tokens by token
+        self._table = [None] * 256
+        self._table2 = {}
+        for token, entry in iteritems(dispatch):
+            if len(token) == 1:
+                self._table[ord(token)] = entry
+            else:
+                self._table2[token] = entry
 
     ###########################################################################
     # auxiliary functions
@@ -413,6 +507,9 @@ class Parser(object):
         """Helper function: parse a scalar or array element."""
         name = ins.read_name()
         error.throw_if(not name, error.STX)
+        if ins.skip_blank() not in _INDEX_OPEN:
+            # scalar, no expressions to evaluate
+            return name, []
         self.redo_on_break = True
         indices = self.expression_parser.parse_indices(ins)
         self.redo_on_break = False
@@ -420,10 +517,10 @@ class Parser(object):
 
     def _parse_jumpnum(self, ins):
         """Parses a line number pointer as in GOTO, GOSUB, LIST, RENUM, EDIT, etc."""
-        ins.require_read((tk.T_UINT,))
-        token = ins.read(2)
-        assert len(token) == 2, 'Bytecode truncated in line number pointer'
-        return struct.unpack('<H', token)[0]
+        ins.require_read(_T_UINT)
+        # truncated bytecode raises ValueError on unpacking
+        low, high = bytearray(ins.read(2))
+        return low | (high << 8)
 
     def _parse_optional_jumpnum(self, ins):
         """Parses a line number pointer as in GOTO, GOSUB, LIST, RENUM, EDIT, etc."""
@@ -435,7 +532,7 @@ class Parser(object):
     def _parse_line_range(self, ins):
         """Parse a line number range as in LIST, DELETE."""
         from_line = self._parse_jumpnum_or_dot(ins, allow_empty=True)
-        if ins.skip_blank_read_if((tk.O_MINUS,)):
+        if ins.skip_blank_read_if(_MINUS):
             to_line = self._parse_jumpnum_or_dot(ins, allow_empty=True)
         else:
             to_line = from_line
@@ -445,9 +542,8 @@ class Parser(object):
         """Parse jump target; returns int, None or '.'"""
         c = ins.skip_blank_read()
         if c == tk.T_UINT:
-            token = ins.read(2)
-            assert len(token) == 2, 'bytecode truncated in line number pointer'
-            return struct.unpack('<H', token)[0]
+            low, high = bytearray(ins.read(2))
+            return low | (high << 8)
         elif c == b'.':
             return b'.'
         else:
@@ -462,28 +558,23 @@ class Parser(object):
     def _parse_nothing(self, ins):
         """Parse nothing."""
         # e.g. TRON LAH raises error but TRON will have been executed
-        return
-        yield
+        return ()
 
     def _parse_end(self, ins):
         """Parse end-of-statement before executing argumentless statement."""
         # e.g. SYSTEM LAH does not execute
         ins.require_end()
-        # empty generator
-        return
-        yield
+        return ()
 
     def _skip_line(self, ins):
         """Ignore the rest of the line."""
         ins.skip_to(tk.END_LINE)
-        return
-        yield
+        return ()
 
     def _skip_statement(self, ins):
         """Ignore rest of statement."""
         ins.skip_to(tk.END_STATEMENT)
-        return
-        yield
+        return ()
 
     ###########################################################################
     # single argument
@@ -508,14 +599,14 @@ class Parser(object):
 
     def _parse_single_line_number(self, ins):
         """Parse statement with single line number argument."""
-        yield self._parse_jumpnum(ins)
+        return (self._parse_jumpnum(ins),)
 
     def _parse_optional_line_number(self, ins):
         """Parse statement with optional line number argument."""
         jumpnum = None
         if ins.skip_blank() == tk.T_UINT:
             jumpnum = self._parse_jumpnum(ins)
-        yield jumpnum
+        return (jumpnum,)
 
     ###########################################################################
     # two arguments
@@ -535,7 +626,7 @@ class Parser(object):
         if c == tk.T_UINT:
             # parse line number and ignore rest of line
             yield self._parse_jumpnum(ins)
-        elif c not in tk.END_STATEMENT:
+        elif c not in _END_STATEMENT:
             yield None
             yield self.parse_expression(ins)
             if ins.skip_blank_read_if((b',',)):
@@ -551,7 +642,7 @@ class Parser(object):
         c = ins.skip_blank()
         if c == tk.NEXT:
             yield ins.read(1)
-        elif c in tk.END_STATEMENT:
+        elif c in _END_STATEMENT:
             yield None
         else:
             yield self._parse_jumpnum(ins)
@@ -559,8 +650,8 @@ class Parser(object):
 
     def _parse_on_error_goto(self, ins):
         """Parse ON ERROR GOTO syntax."""
-        ins.require_read((tk.ERROR,))
-        ins.require_read((tk.GOTO,))
+        ins.require_read(_ERROR)
+        ins.require_read(_GOTO)
         yield self._parse_jumpnum(ins)
 
     ###########################################################################
@@ -568,28 +659,28 @@ class Parser(object):
 
     def _parse_event_command(self, ins):
         """Parse PEN, PLAY or TIMER syntax."""
-        yield ins.require_read((tk.ON, tk.OFF, tk.STOP))
+        yield ins.require_read(_ON_OFF_STOP)
 
     def _parse_com_command(self, ins):
         """Parse KEY, COM or STRIG syntax."""
         yield self._parse_bracket(ins)
-        yield ins.require_read((tk.ON, tk.OFF, tk.STOP))
+        yield ins.require_read(_ON_OFF_STOP)
 
     def _parse_strig_switch(self, ins):
         """Parse STRIG ON/OFF syntax."""
-        yield ins.require_read((tk.ON, tk.OFF))
+        yield ins.require_read(_ON_OFF)
 
     def _parse_on_event(self, ins):
         """Helper function for ON event trap definitions."""
         token = ins.read_keyword_token()
         yield token
-        if token not in (tk.PEN, tk.KEY, tk.TIMER, tk.PLAY, tk.COM, tk.STRIG):
+        if token not in _EVENTS:
             raise error.BASICError(error.STX)
         if token != tk.PEN:
             yield self._parse_bracket(ins)
         else:
             yield None
-        ins.require_read((tk.GOSUB,))
+        ins.require_read(_GOSUB)
         yield self._parse_jumpnum(ins)
         ins.require_end()
 
@@ -598,9 +689,9 @@ class Parser(object):
 
     def _parse_beep(self, ins):
         """Parse BEEP syntax."""
-        if self._syntax in ('pcjr', 'tandy'):
+        if self._pcjr_syntax:
             # Tandy/PCjr BEEP ON, OFF
-            yield ins.skip_blank_read_if((tk.ON, tk.OFF))
+            yield ins.skip_blank_read_if(_ON_OFF)
         else:
             yield None
         # if a syntax error happens, we still beeped.
@@ -617,9 +708,9 @@ class Parser(object):
     def _parse_sound(self, ins):
         """Parse SOUND syntax."""
         command = None
-        if self._syntax in ('pcjr', 'tandy'):
+        if self._pcjr_syntax:
             # Tandy/PCjr SOUND ON, OFF
-            command = ins.skip_blank_read_if((tk.ON, tk.OFF))
+            command = ins.skip_blank_read_if(_ON_OFF)
         if command:
             yield command
         else:
@@ -629,7 +720,7 @@ class Parser(object):
             yield dur
             # only look for args 3 and 4 if duration is > 0;
             # otherwise those args are a syntax error (on tandy)
-            if (dur.sign() == 1) and ins.skip_blank_read_if((b',',)) and self._syntax in ('pcjr', 'tandy'):
+            if (dur.sign() == 1) and ins.skip_blank_read_if((b',',)) and self._pcjr_syntax:
                 yield self.parse_expression(ins)
                 if ins.skip_blank_read_if((b',',)):
                     yield self.parse_expression(ins)
@@ -642,7 +733,7 @@ class Parser(object):
 
     def _parse_play(self, ins):
         """Parse PLAY (music) syntax."""
-        if self._syntax in ('pcjr', 'tandy'):
+        if self._pcjr_syntax:
             for _ in range(3):
                 last = self.parse_expression(ins, allow_empty=True)
                 yield last
@@ -663,17 +754,17 @@ class Parser(object):
     def _parse_def_seg(self, ins):
         """Parse DEF SEG syntax."""
         # must be uppercase in tokenised form, otherwise syntax error
-        ins.require_read((tk.W_SEG,))
-        if ins.skip_blank_read_if((tk.O_EQ,)):
+        ins.require_read(_SEG)
+        if ins.skip_blank_read_if(_EQ):
             yield self.parse_expression(ins)
         else:
             yield None
 
     def _parse_def_usr(self, ins):
         """Parse DEF USR syntax."""
-        ins.require_read((tk.USR,))
+        ins.require_read(_USR)
         yield ins.skip_blank_read_if(tk.DIGIT)
-        ins.require_read((tk.O_EQ,))
+        ins.require_read(_EQ)
         yield self.parse_expression(ins)
 
     def _parse_bload(self, ins):
@@ -731,7 +822,7 @@ class Parser(object):
         """Parse NAME syntax."""
         yield self.parse_expression(ins)
         # AS is not a tokenised word
-        ins.require_read((tk.W_AS,))
+        ins.require_read(_AS)
         yield self.parse_expression(ins)
 
     ###########################################################################
@@ -739,7 +830,7 @@ class Parser(object):
 
     def _parse_time_date(self, ins):
         """Parse TIME$ or DATE$ syntax."""
-        ins.require_read((tk.O_EQ,))
+        ins.require_read(_EQ)
         yield self.parse_expression(ins)
         ins.require_end()
 
@@ -753,7 +844,7 @@ class Parser(object):
 
     def _parse_edit(self, ins):
         """Parse EDIT syntax."""
-        if ins.skip_blank() not in tk.END_STATEMENT:
+        if ins.skip_blank() not in _END_STATEMENT:
             yield self._parse_jumpnum_or_dot(ins, err=error.IFC)
         else:
             yield None
@@ -804,7 +895,7 @@ class Parser(object):
     def _parse_renum(self, ins):
         """Parse RENUM syntax."""
         new, old, step = None, None, None
-        if ins.skip_blank() not in tk.END_STATEMENT:
+        if ins.skip_blank() not in _END_STATEMENT:
             new = self._parse_jumpnum_or_dot(ins, allow_empty=True)
             if ins.skip_blank_read_if((b',',)):
                 old = self._parse_jumpnum_or_dot(ins, allow_empty=True)
@@ -824,7 +915,8 @@ class Parser(object):
 
     def _parse_chain(self, ins):
         """Parse CHAIN syntax."""
-        yield ins.skip_blank_read_if((tk.MERGE,)) is not None
+        # MERGE token or None; used as a flag
+        yield ins.skip_blank_read_if(_MERGE)
         yield self.parse_expression(ins)
         jumpnum, common_all, delete_range = None, False, True
         if ins.skip_blank_read_if((b',',)):
@@ -832,16 +924,16 @@ class Parser(object):
             # This is not stored as a jumpnum (to avoid RENUM)
             jumpnum = self.parse_expression(ins, allow_empty=True)
             if ins.skip_blank_read_if((b',',)):
-                common_all = ins.skip_blank_read_if((tk.W_ALL,), 3)
+                common_all = ins.skip_blank_read_if(_ALL, 3)
                 if common_all:
                     # CHAIN "file", , ALL, DELETE
                     delete_range = ins.skip_blank_read_if((b',',))
                 # CHAIN "file", , DELETE
         yield jumpnum
         yield common_all
-        if delete_range and ins.skip_blank_read_if((tk.DELETE,)):
+        if delete_range and ins.skip_blank_read_if(_DELETE):
             from_line = self._parse_optional_jumpnum(ins)
-            if ins.skip_blank_read_if((tk.O_MINUS,)):
+            if ins.skip_blank_read_if(_MINUS):
                 to_line = self._parse_optional_jumpnum(ins)
             else:
                 to_line = from_line
@@ -864,72 +956,63 @@ class Parser(object):
         first_syntax = ins.skip_blank_read_if((b',',))
         yield first_syntax
         if first_syntax:
-            args = self._parse_open_first(ins)
-        else:
-            args = self._parse_open_second(ins)
-        for a in args:
-            yield a
-
-    def _parse_open_first(self, ins):
-        """Parse OPEN first ('old') syntax."""
-        ins.skip_blank_read_if((b'#',))
-        yield self.parse_expression(ins)
-        ins.require_read((b',',))
-        yield self.parse_expression(ins)
-        if ins.skip_blank_read_if((b',',)):
+            # first ('old') syntax
+            ins.skip_blank_read_if((b'#',))
             yield self.parse_expression(ins)
-        else:
-            yield None
-
-    def _parse_open_second(self, ins):
-        """Parse OPEN second ('new') syntax."""
+            ins.require_read((b',',))
+            yield self.parse_expression(ins)
+            if ins.skip_blank_read_if((b',',)):
+                yield self.parse_expression(ins)
+            else:
+                yield None
+            return
+        # second ('new') syntax
         # mode clause
-        if ins.skip_blank_read_if((tk.FOR,)):
+        if ins.skip_blank_read_if(_FOR):
             # read mode word
-            if ins.skip_blank_read_if((tk.INPUT,)):
+            if ins.skip_blank_read_if(_INPUT):
                 yield b'I'
             else:
-                mode_dict = {tk.W_OUTPUT: b'O', tk.W_RANDOM: b'R', tk.W_APPEND: b'A'}
-                word = ins.skip_blank_read_if(mode_dict, 6)
+                word = ins.skip_blank_read_if(_OPEN_FOR_MODES, 6)
                 if word is not None:
-                    yield mode_dict[word]
+                    yield _OPEN_FOR_MODES[word]
                 else:
                     raise error.BASICError(error.STX)
         else:
             yield None
         # ACCESS clause
-        if ins.skip_blank_read_if((tk.W_ACCESS,), 6):
+        if ins.skip_blank_read_if(_ACCESS, 6):
             yield self._parse_read_write(ins)
         else:
             yield None
         # LOCK clause
-        if ins.skip_blank_read_if((tk.LOCK,), 2):
+        if ins.skip_blank_read_if(_LOCK, 2):
             yield self._parse_read_write(ins)
         else:
-            yield ins.skip_blank_read_if((tk.W_SHARED,), 6)
+            yield ins.skip_blank_read_if(_SHARED, 6)
         # AS file number clause
-        ins.require_read((tk.W_AS,))
+        ins.require_read(_AS)
         ins.skip_blank_read_if((b'#',))
         yield self.parse_expression(ins)
         # LEN clause
-        if ins.skip_blank_read_if((tk.LEN,), 2):
-            ins.require_read((tk.O_EQ,))
+        if ins.skip_blank_read_if(_LEN, 2):
+            ins.require_read(_EQ)
             yield self.parse_expression(ins)
         else:
             yield None
 
     def _parse_read_write(self, ins):
         """Parse access mode for OPEN."""
-        d = ins.skip_blank_read_if((tk.READ, tk.WRITE))
+        d = ins.skip_blank_read_if(_READ_WRITE)
         if d == tk.WRITE:
             return b'W'
         elif d == tk.READ:
-            return b'RW' if ins.skip_blank_read_if((tk.WRITE,)) else b'R'
+            return b'RW' if ins.skip_blank_read_if(_WRITE) else b'R'
         raise error.BASICError(error.STX)
 
     def _parse_close(self, ins):
         """Parse CLOSE syntax."""
-        if ins.skip_blank() not in tk.END_STATEMENT:
+        if ins.skip_blank() not in _END_STATEMENT:
             while True:
                 # if an error occurs, the files parsed before are closed anyway
                 ins.skip_blank_read_if((b'#',))
@@ -944,7 +1027,7 @@ class Parser(object):
         if ins.skip_blank_read_if((b',',)):
             while True:
                 yield self.parse_expression(ins)
-                ins.require_read((tk.W_AS,), err=error.IFC)
+                ins.require_read(_AS, err=error.IFC)
                 yield self._parse_variable(ins)
                 if not ins.skip_blank_read_if((b',',)):
                     break
@@ -960,7 +1043,7 @@ class Parser(object):
         else:
             expr = self.parse_expression(ins, allow_empty=True)
             yield expr
-            if ins.skip_blank_read_if((tk.TO,)):
+            if ins.skip_blank_read_if(_TO):
                 yield self.parse_expression(ins)
             elif expr is not None:
                 yield None
@@ -996,7 +1079,7 @@ class Parser(object):
 
     def _parse_pset_preset(self, ins):
         """Parse PSET and PRESET syntax."""
-        yield ins.skip_blank_read_if((tk.STEP,))
+        yield ins.skip_blank_read_if(_STEP)
         for c in self._parse_pair(ins):
             yield c
         if ins.skip_blank_read_if((b',',)):
@@ -1007,12 +1090,12 @@ class Parser(object):
 
     def _parse_window(self, ins):
         """Parse WINDOW syntax."""
-        screen = ins.skip_blank_read_if((tk.SCREEN,))
+        screen = ins.skip_blank_read_if(_SCREEN)
         yield screen
         if ins.skip_blank() == b'(':
             for c in self._parse_pair(ins):
                 yield c
-            ins.require_read((tk.O_MINUS,))
+            ins.require_read(_MINUS)
             for c in self._parse_pair(ins):
                 yield c
         elif screen:
@@ -1020,7 +1103,7 @@ class Parser(object):
 
     def _parse_circle(self, ins):
         """Parse CIRCLE syntax."""
-        yield ins.skip_blank_read_if((tk.STEP,))
+        yield ins.skip_blank_read_if(_STEP)
         for c in self._parse_pair(ins):
             yield c
         ins.require_read((b',',))
@@ -1040,7 +1123,7 @@ class Parser(object):
 
     def _parse_paint(self, ins):
         """Parse PAINT syntax."""
-        yield ins.skip_blank_read_if((tk.STEP,))
+        yield ins.skip_blank_read_if(_STEP)
         for last in self._parse_pair(ins):
             yield last
         for count_args in range(3):
@@ -1056,11 +1139,11 @@ class Parser(object):
 
     def _parse_view(self, ins):
         """Parse VIEW syntax."""
-        yield ins.skip_blank_read_if((tk.SCREEN,))
+        yield ins.skip_blank_read_if(_SCREEN)
         if ins.skip_blank() == b'(':
             for c in self._parse_pair(ins):
                 yield c
-            ins.require_read((tk.O_MINUS,))
+            ins.require_read(_MINUS)
             for c in self._parse_pair(ins):
                 yield c
             if ins.skip_blank_read_if((b',',)):
@@ -1074,15 +1157,15 @@ class Parser(object):
 
     def _parse_line(self, ins):
         """Parse LINE syntax."""
-        if ins.skip_blank() in (b'(', tk.STEP):
-            yield ins.skip_blank_read_if((tk.STEP,))
+        if ins.skip_blank() in _PAREN_STEP:
+            yield ins.skip_blank_read_if(_STEP)
             for c in self._parse_pair(ins):
                 yield c
         else:
             for _ in range(3):
                 yield None
-        ins.require_read((tk.O_MINUS,))
-        yield ins.skip_blank_read_if((tk.STEP,))
+        ins.require_read(_MINUS)
+        yield ins.skip_blank_read_if(_STEP)
         for c in self._parse_pair(ins):
             yield c
         if ins.skip_blank_read_if((b',',)):
@@ -1117,8 +1200,8 @@ class Parser(object):
         # don't accept STEP for first coord
         for c in self._parse_pair(ins):
             yield c
-        ins.require_read((tk.O_MINUS,))
-        yield ins.skip_blank_read_if((tk.STEP,))
+        ins.require_read(_MINUS)
+        yield ins.skip_blank_read_if(_STEP)
         for c in self._parse_pair(ins):
             yield c
         ins.require_read((b',',))
@@ -1133,7 +1216,7 @@ class Parser(object):
         ins.require_read((b',',))
         yield self.parse_name(ins)
         if ins.skip_blank_read_if((b',',)):
-            yield ins.require_read((tk.PSET, tk.PRESET, tk.AND, tk.OR, tk.XOR))
+            yield ins.require_read(_PUT_ACTIONS)
         else:
             yield None
         ins.require_end()
@@ -1155,7 +1238,7 @@ class Parser(object):
                 # set aside stack space for GW-BASIC. The default is the previous stack space size.
                 exp2 = self.parse_expression(ins, allow_empty=True)
                 yield exp2
-                if self._syntax in ('pcjr', 'tandy') and ins.skip_blank_read_if((b',',)):
+                if self._pcjr_syntax and ins.skip_blank_read_if((b',',)):
                     # Tandy/PCjr: select video memory size
                     yield self.parse_expression(ins)
                 elif not exp2:
@@ -1164,27 +1247,37 @@ class Parser(object):
 
     def _parse_def_fn(self, ins):
         """DEF FN: define a function."""
-        ins.require_read((tk.FN,))
+        ins.require_read(_FN)
         yield self.parse_name(ins)
 
     def _parse_var_list(self, ins):
         """Generator: lazily parse variable list."""
+        parse_variable = self._parse_variable
+        skip_blank_read_if = ins.skip_blank_read_if
         while True:
-            yield self._parse_variable(ins)
-            if not ins.skip_blank_read_if((b',',)):
+            yield parse_variable(ins)
+            if not skip_blank_read_if((b',',)):
                 break
 
     def _parse_deftype(self, ins):
         """Parse DEFSTR/DEFINT/DEFSNG/DEFDBL syntax."""
         while True:
-            start = ins.require_read(tuple(iterchar(LETTERS)))
+            start = self._require_letter(ins)
             stop = None
-            if ins.skip_blank_read_if((tk.O_MINUS,)):
-                stop = ins.require_read(tuple(iterchar(LETTERS)))
+            if ins.skip_blank_read_if(_MINUS):
+                stop = self._require_letter(ins)
             yield start, stop
             if not ins.skip_blank_read_if((b',',)):
                 break
 
+    def _require_letter(self, ins):
+        """Skip whitespace, read a letter and raise syntax error if not found."""
+        d = ins.skip_blank_read()
+        if d not in _LETTERS:
+            ins.seek(-len(d), 1)
+            raise error.BASICError(error.STX)
+        return d
+
     def _parse_erase(self, ins):
         """Parse ERASE syntax."""
         while True:
@@ -1192,10 +1285,16 @@ class Parser(object):
             if not ins.skip_blank_read_if((b',',)):
                 break
 
+    def _parse_implicit_let(self, ins):
+        """Parse LET syntax without the LET keyword."""
+        # the leading letter is part of the variable name
+        ins.seek(-1, 1)
+        return self._parse_let(ins)
+
     def _parse_let(self, ins):
         """Parse LET, LSET or RSET syntax."""
         yield self._parse_variable(ins)
-        ins.require_read((tk.O_EQ,))
+        ins.require_read(_EQ)
         # we're not using a temp string here
         # as it would delete the new string generated by let if applied to a code literal
         yield self.parse_expression(ins)
@@ -1213,7 +1312,7 @@ class Parser(object):
         else:
             yield None
         ins.require_read((b')',))
-        ins.require_read((tk.O_EQ,))
+        ins.require_read(_EQ)
         # we're not using a temp string here
         # as it would delete the new string generated by midset if applied to a code literal
         yield self.parse_expression(ins)
@@ -1221,7 +1320,7 @@ class Parser(object):
 
     def _parse_option_base(self, ins):
         """Parse OPTION BASE syntax."""
-        ins.require_read((tk.W_BASE,))
+        ins.require_read(_BASE)
         # MUST be followed by ASCII '1' or '0', num constants or expressions are an error!
         yield ins.require_read((b'0', b'1'))
 
@@ -1250,7 +1349,7 @@ class Parser(object):
 
     def _parse_line_input(self, ins):
         """Parse LINE INPUT syntax."""
-        ins.require_read((tk.INPUT,))
+        ins.require_read(_INPUT)
         if ins.skip_blank_read_if((b'#',)):
             yield self.parse_expression(ins)
             ins.require_read((b',',))
@@ -1324,7 +1423,7 @@ class Parser(object):
 
     def _parse_palette_using(self, ins):
         """Parse PALETTE USING syntax."""
-        ins.require_read((tk.USING,))
+        ins.require_read(_USING)
         array_name, start_indices = self._parse_variable(ins)
         yield array_name, start_indices
         # brackets are not optional
@@ -1342,11 +1441,11 @@ class Parser(object):
 
     def _parse_view_print(self, ins):
         """Parse VIEW PRINT syntax."""
-        ins.require_read((tk.PRINT,))
+        ins.require_read(_PRINT)
         start = self.parse_expression(ins, allow_empty=True)
         yield start
         if start is not None:
-            ins.require_read((tk.TO,))
+            ins.require_read(_TO)
             yield self.parse_expression(ins)
         else:
             yield None
@@ -1359,16 +1458,18 @@ class Parser(object):
             ins.require_read((b',',))
         else:
             yield None
-        if ins.skip_blank() not in tk.END_STATEMENT:
+        if ins.skip_blank() not in _END_STATEMENT:
+            parse_expression = self.parse_expression
+            skip_blank_read_if = ins.skip_blank_read_if
             while True:
-                yield self.parse_expression(ins)
-                if not ins.skip_blank_read_if((b',', b';')):
+                yield parse_expression(ins)
+                if not skip_blank_read_if((b',', b';')):
                     break
             ins.require_end()
 
     def _parse_width(self, ins):
         """Parse WIDTH syntax."""
-        d = ins.skip_blank_read_if((b'#', tk.LPRINT))
+        d = ins.skip_blank_read_if(_HASH_LPRINT)
         if d:
             if d == b'#':
                 yield self.parse_expression(ins)
@@ -1378,7 +1479,7 @@ class Parser(object):
             yield self.parse_expression(ins)
         else:
             yield None
-            if ins.peek() in set(iterchar(DIGITS)) | set(tk.NUMBER):
+            if ins.peek() in _NUMBER_START:
                 expr = self.expression_parser.read_number_literal(ins)
             else:
                 expr = self.parse_expression(ins)
@@ -1422,7 +1523,11 @@ class Parser(object):
         yield self.parse_expression(ins)
         ins.require_end()
 
-    def _parse_print(self, ins, parse_file):
+    def _parse_lprint(self, ins):
+        """Parse LPRINT syntax."""
+        return self._parse_print(ins, parse_file=False)
+
+    def _parse_print(self, ins, parse_file=True):
         """Parse PRINT or LPRINT syntax."""
         if parse_file:
             if ins.skip_blank_read_if((b'#',)):
@@ -1430,9 +1535,12 @@ class Parser(object):
                 ins.require_read((b',',))
             else:
                 yield None
+        # local bindings for the argument loop
+        skip_blank_read = ins.skip_blank_read
+        parse_expression = self.parse_expression
         while True:
-            d = ins.skip_blank_read()
-            if d in tk.END_STATEMENT:
+            d = skip_blank_read()
+            if d in _END_STATEMENT:
                 ins.seek(-len(d), 1)
                 break
             elif d == tk.USING:
@@ -1441,7 +1549,7 @@ class Parser(object):
                 ins.require_read((b';',))
                 has_args = False
                 while True:
-                    expr = self.parse_expression(ins, allow_empty=True)
+                    expr = parse_expression(ins, allow_empty=True)
                     yield expr
                     if expr is None:
                         ins.require_end()
@@ -1453,16 +1561,16 @@ class Parser(object):
                     if not ins.skip_blank_read_if((b';', b',')):
                         break
                 break
-            elif d in (b',', b';'):
+            elif d in _PRINT_SEPARATORS:
                 yield (d, None)
-            elif d in (tk.SPC, tk.TAB):
-                num = self.parse_expression(ins)
+            elif d in _SPC_TAB:
+                num = parse_expression(ins)
                 ins.require_read((b')',))
                 yield (d, num)
             else:
                 ins.seek(-len(d), 1)
                 yield (None, None)
-                yield self.parse_expression(ins)
+                yield parse_expression(ins)
 
     ###########################################################################
     # loops and branches
@@ -1470,13 +1578,15 @@ class Parser(object):
     def _parse_on_jump(self, ins):
         """ON: calculated jump."""
         yield self.parse_expression(ins)
-        yield ins.require_read((tk.GOTO, tk.GOSUB))
+        yield ins.require_read(_GOTO_GOSUB)
+        parse_optional_jumpnum = self._parse_optional_jumpnum
+        skip_blank_read_if = ins.skip_blank_read_if
         while True:
-            num = self._parse_optional_jumpnum(ins)
+            num = parse_optional_jumpnum(ins)
             if num is None:
                 break
             yield num
-            if not ins.skip_blank_read_if((b',',)):
+            if not skip_blank_read_if((b',',)):
                 break
         ins.require_end()
 
@@ -1486,7 +1596,7 @@ class Parser(object):
         condition = self.parse_expression(ins)
         # optional comma
         ins.skip_blank_read_if((b',',))
-        ins.require_read((tk.THEN, tk.GOTO))
+        ins.require_read(_THEN_GOTO)
         # THEN and GOTO tokens both have length 1
         start_pos = ins.tell() - 1
         # allow cofunction to evaluate condition
@@ -1502,14 +1612,14 @@ class Parser(object):
             # ELSEs may be nested in the THEN clause
             nesting_level = 0
             while True:
-                d = ins.skip_to_read(tk.END_STATEMENT + (tk.IF,))
+                d = ins.skip_to_read(_END_STATEMENT_IF)
                 if d == tk.IF:
                     # nesting step on IF. (it's less convenient to count THENs
                     # because they could be THEN or GOTO)
                     nesting_level += 1
                 elif d == b':':
                     # :ELSE is ELSE; may be whitespace in between. no : means it's ignored.
-                    if ins.skip_blank_read_if((tk.ELSE,)):
+                    if ins.skip_blank_read_if(_ELSE):
                         # ELSE has length 1
                         start_pos = ins.tell() - 1
                         if nesting_level > 0:
@@ -1530,11 +1640,11 @@ class Parser(object):
         """Parse FOR syntax."""
         # read variable
         yield self.parse_name(ins)
-        ins.require_read((tk.O_EQ,))
+        ins.require_read(_EQ)
         yield self.parse_expression(ins)
-        ins.require_read((tk.TO,))
+        ins.require_read(_TO)
         yield self.parse_expression(ins)
-        if ins.skip_blank_read_if((tk.STEP,)):
+        if ins.skip_blank_read_if(_STEP):
             yield self.parse_expression(ins)
         else:
             yield None
@@ -1545,7 +1655,7 @@ class Parser(object):
         # note that next_ will not run the full generator if it finds a loop to iterate
         while True:
             # optional var name, errors have been checked during _find_next scan
-            if ins.skip_blank() not in tk.END_STATEMENT + (b',',):
+            if ins.skip_blank() not in _END_STATEMENT_COMMA:
                 yield self.parse_name(ins)
             else:
                 yield None
@@ -39,6 +39,9 @@ NOTES = {
     b'G-': 6, b'G': 7, b'G#': 8, b'A-': 8, b'A': 9, b'A#': 10, b'B-': 10, b'B': 11
 }
 
+# digit characters in note lengths
+_DIGITS = set(iterchar(DIGITS))
+
 # critical duration value below which sound loops
 # in BASIC, 1/44 = 0.02272727248 which is '\x8c\x2e\x3a\x7b'
 LOOP_THRESHOLD = 0.02272727248
@@ -262,8 +265,13 @@ class Sound(object):
 
     def play_(self,  args):
         """Parse a list of Music Macro Language strings (PLAY statement)."""
-        # retrieve Music Macro Language string
-        mml_list = list(values.next_string(args) for _ in range(3))
+        # retrieve Music Macro Language strings, only as many as were given
+        mml_list = []
+        for _ in range(3):
+            try:
+                mml_list.append(values.next_string(args))
+            except StopIteration:
+                break
         list(args)
         # at least one string must be specified
         if not any(mml_list):
@@ -344,7 +352,7 @@ class Sound(object):
                     c = mmls.skip_blank_read_if(DIGITS)
                     if c is not None:
                         numstr = [c]
-                        while mmls.skip_blank() in set(iterchar(DIGITS)):
+                        while mmls.skip_blank() in _DIGITS:
                             numstr.append(mmls.read(1))
                         # NOT ml_parse_number, only literals allowed here!
                         length = int(b''.join(numstr))
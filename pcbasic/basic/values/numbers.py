@@ -889,11 +889,12 @@ class Float(Number):
 
     def _denormalise(self):
         """Denormalise to shifted mantissa, exp, sign."""
-        exp = bytearray(self._buffer)[-1]
-        man = struct.unpack(
-                self._intformat, b'\0' + bytearray(self._buffer)[:-1]
-            )[0] | self._den_mask
-        neg = self.is_negative()
+        # take a single copy of the buffer for all three fields
+        buf = bytearray(self._buffer)
+        exp = buf[-1]
+        man = struct.unpack(self._intformat, b'\0' + buf[:-1])[0] | self._den_mask
+        # sign bit, see is_negative
+        neg = buf[-2] >= 0x80
         return exp, man, neg
 
     def _normalise(self, exp, man, neg):
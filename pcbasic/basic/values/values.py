@@ -347,15 +347,10 @@ def cdbl_(args):
 
 def to_type(typechar, value):
     """Check if variable can be converted to the given type and convert if necessary."""
-    if typechar == STR:
-        return pass_string(value)
-    elif typechar == INT:
-        return to_integer(value)
-    elif typechar == SNG:
-        return to_single(value)
-    elif typechar == DBL:
-        return to_double(value)
-    raise ValueError('%s is not a valid sigil.' % typechar)
+    convert = TYPE_TO_CONV.get(typechar)
+    if convert is None:
+        raise ValueError('%s is not a valid sigil.' % typechar)
+    return convert(value)
 
 # NOTE that this function will overflow if outside the range of Integer
 # whereas Float.to_int will not
@@ -0,0 +1,60 @@
+"""
+Keyboard ring buffer: appending while startup keystrokes overflow the ring.
+"""
+
+from pcbasic.compat import iterchar
+from pcbasic.basic.inputs.keyboard import KeyboardBuffer
+
+
+class AudioQueue(object):
+
+    def __init__(self):
+        self.tones = 0
+
+    def put(self, signal):
+        self.tones += 1
+
+
+class Queues(object):
+
+    def __init__(self):
+        self.audio = AudioQueue()
+
+
+def drain(buf):
+    out = []
+    while not buf.empty:
+        out.append(buf.getc())
+    return b''.join(out)
+
+
+keys = list(iterchar(b'ABCDEFGHIJKLMNOPQRST'))
+
+# a keystroke appended while the ring is overflowing is dropped with a beep
+# and must not overwrite any keystrokes still queued
+queues = Queues()
+buf = KeyboardBuffer(queues, 16, check_full=True)
+buf.insert(keys)
+buf.append(b'X', 0x2d)
+assert queues.audio.tones == 1
+assert drain(buf) == b'ABCDEFGHIJKLMNOPQRST'
+
+# while overflowing, the ring shows the most recent keystrokes at their ring positions
+buf = KeyboardBuffer(Queues(), 16, check_full=True)
+buf.insert(keys)
+assert [buf.ring_read(_i)[0] for _i in range(16)] == keys[16:] + keys[4:16]
+buf.ring_write(0, b'x', None)
+buf.ring_write(4, b'e', None)
+assert drain(buf) == b'ABCDeFGHIJKLMNOPxRST'
+
+# with one free slot left, the full-buffer \r goes into that slot and is not counted
+queues = Queues()
+buf = KeyboardBuffer(queues, 16, check_full=True)
+buf.insert(keys[:15])
+buf.append(b'X', 0x2d)
+assert queues.audio.tones == 1
+assert buf.length == 15
+assert buf.ring_read(buf.stop)[0] == b'\r'
+assert drain(buf) == b'ABCDEFGHIJKLMNO'
+
+print('ok')
@@ -1,6 +1,7 @@
 
 import sys
 import os
+import struct
 from binascii import hexlify
 
 
@@ -34,6 +35,9 @@ if __name__ == '__main__':
 
     print 'allbytes-add'
 
+    # operands are rewritten in place on each iteration
+    bufl, bufr = bytearray(4), bytearray(4)
+    l, r = Single(bufl, vm), Single(bufr, vm)
     with open('input/ALLWORD.DAT', 'rb') as f:
         with open ('model/GWBASABY.DAT', 'rb') as h:
             with open('output/ADDBYTE.DAT', 'wb') as g:
@@ -42,12 +46,11 @@ if __name__ == '__main__':
                         buf = bytearray(f.read(4))
                         if len(buf) < 4:
                             break
-                        bufl = bytearray('%c\0\0\80' % buf[0])
-                        bufr = bytearray('%c\0\0\80' % buf[1])
+                        bufl[:] = b'\0\0\0\x80'
+                        bufr[:] = b'\0\0\0\x80'
+                        bufl[0], bufr[0] = buf[0], buf[1]
 
-                        l = Single(bufl, vm)
                         bufs = bytes(bufl), bytes(bufr)
-                        r = Single(bufr, vm)
                         out = bytes(l.iadd(r).to_bytes())
                         g.write(out)
                         inp = h.read(4)
@@ -57,6 +60,9 @@ if __name__ == '__main__':
 
     print 'allbytes-sub'
 
+    # operands are rewritten in place on each iteration
+    bufl, bufr = bytearray(4), bytearray(4)
+    l, r = Single(bufl, vm), Single(bufr, vm)
     with open('input/ALLWORD.DAT', 'rb') as f:
         with open ('model/GWBASSBY.DAT', 'rb') as h:
             with open('output/SUBBYTE.DAT', 'wb') as g:
@@ -65,12 +71,11 @@ if __name__ == '__main__':
                         buf = bytearray(f.read(4))
                         if len(buf) < 4:
                             break
-                        bufl = bytearray('%c\0\0\80' % buf[0])
-                        bufr = bytearray('%c\0\0\80' % buf[1])
+                        bufl[:] = b'\0\0\0\x80'
+                        bufr[:] = b'\0\0\0\x80'
+                        bufl[0], bufr[0] = buf[0], buf[1]
 
-                        l = Single(bufl, vm)
                         bufs = bytes(bufl), bytes(bufr)
-                        r = Single(bufr, vm)
                         out = bytes(l.isub(r).to_bytes())
                         g.write(out)
                         inp = h.read(4)
@@ -89,11 +94,11 @@ if __name__ == '__main__':
                 with open('output/ALLWORD'+letter+'.DAT', 'wb') as g:
                         while True:
                             l = r
-                            l.view()[3:] = int2byte(0x80+shift)
+                            struct.pack_into('B', l.view(), 3, 0x80+shift)
                             buf = bytearray(f.read(4))
                             if len(buf) < 4:
                                 break
-                            buf[2:] = '\0\x80'
+                            buf[2], buf[3] = 0, 0x80
                             r = Single(buf, vm)
                             ll = l.clone()
                             bufs = bytes(l.to_bytes()), bytes(buf)
@@ -119,11 +124,11 @@ if __name__ == '__main__':
                 with open('output/LO'+letter+'.DAT', 'wb') as g:
                         while True:
                             l = r
-                            l.view()[3:] = int2byte(0x80+shift)
+                            struct.pack_into('B', l.view(), 3, 0x80+shift)
                             buf = bytearray(f.read(4))
                             if len(buf) < 4:
                                 break
-                            buf[2:] = '\0\x80'
+                            buf[2], buf[3] = 0, 0x80
                             r = Single(buf, vm)
                             ll = l.clone()
                             bufs = bytes(l.to_bytes()), bytes(buf)